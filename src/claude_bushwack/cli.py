@@ -1,15 +1,19 @@
 """CLI interface for claude-bushwack."""
 
 import os
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
-from .conversation_metadata import ConversationMetadata, extract_conversation_metadata
+from .conversation_metadata import (
+  ConversationMetadata,
+  extract_conversation_metadata,
+  extract_conversation_preview,
+)
 from .core import ClaudeConversationManager
 from .exceptions import (
   AmbiguousSessionIDError,
@@ -18,7 +22,36 @@ from .exceptions import (
   InvalidUUIDError,
 )
 
-console = Console()
+if TYPE_CHECKING:
+  from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def _console() -> 'Console':
+  # Rich is imported on first output so `--help` and usage errors start faster.
+  from rich.console import Console
+
+  return Console()
+
+
+# Shared fallback for conversations without extracted metadata; never mutated.
+_EMPTY_METADATA = ConversationMetadata()
+
+# Trees larger than this are paged when writing to a terminal so the first
+# screen appears without rendering the whole tree up front.
+_PAGER_THRESHOLD = 500
+
+# Below this many conversations, thread start-up costs more than it saves.
+_PARALLEL_METADATA_THRESHOLD = 16
+
+
+def _format_timestamp(value: datetime) -> str:
+  # Equivalent to strftime('%Y-%m-%d %H:%M') without parsing a format string
+  # for every row.
+  return (
+    f'{value.year:04d}-{value.month:02d}-{value.day:02d} '
+    f'{value.hour:02d}:{value.minute:02d}'
+  )
 
 
 def _format_created(value: datetime) -> str:
@@ -29,7 +62,29 @@ def _format_created(value: datetime) -> str:
       localized = value
   else:
     localized = value
-  return localized.strftime('%Y-%m-%d %H:%M')
+  return _format_timestamp(localized)
+
+
+def _default_jobs() -> int:
+  return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _load_metadata(conversations, extract, jobs):
+  """Run ``extract`` for every conversation, in parallel for large sets."""
+  if jobs is None:
+    jobs = _default_jobs()
+  if jobs <= 1 or len(conversations) < _PARALLEL_METADATA_THRESHOLD:
+    return {conversation.uuid: extract(conversation) for conversation in conversations}
+
+  from concurrent.futures import ThreadPoolExecutor
+
+  # Metadata extraction is dominated by file reads, which release the GIL.
+  with ThreadPoolExecutor(max_workers=min(jobs, len(conversations))) as executor:
+    results = executor.map(extract, conversations)
+    return {
+      conversation.uuid: metadata
+      for conversation, metadata in zip(conversations, results)
+    }
 
 
 def _format_summary(metadata: ConversationMetadata) -> str:
@@ -42,6 +97,67 @@ def _format_summary(metadata: ConversationMetadata) -> str:
   return 'no summary'
 
 
+def _print_conversation_tree(conversations, roots, children_dict, metadata_map):
+  console = _console()
+  if roots:
+    from rich.tree import Tree
+
+    tree_view = Tree('🌳 Conversation Tree')
+
+    def conversation_label(conv):
+      metadata = metadata_map.get(conv.uuid, _EMPTY_METADATA)
+      created_at = metadata.created_at or conv.last_modified
+      created_text = _format_created(created_at)
+      summary_text = _format_summary(metadata)
+      branch_label = ''
+      if conv.parent_uuid:
+        branch_label = f' (branch of {conv.parent_uuid[:8]}...)'
+
+      # Create label with conversation info
+      return (
+        f'[cyan]{conv.uuid[:8]}...[/cyan] {created_text}{branch_label} - {summary_text}'
+      )
+
+    # Order every sibling list once rather than on each visit.
+    for siblings in children_dict.values():
+      siblings.sort(key=lambda c: c.last_modified)
+
+    # Walk depth-first with an explicit stack so deep branch chains cannot hit
+    # the recursion limit. Entries are pushed in reverse so they pop in order.
+    sorted_roots = sorted(roots, key=lambda c: c.last_modified, reverse=True)
+    stack = [(tree_view, root) for root in reversed(sorted_roots)]
+    while stack:
+      parent_node, conv = stack.pop()
+      conv_node = parent_node.add(conversation_label(conv))
+      children = children_dict.get(conv.uuid)
+      if children:
+        stack.extend((conv_node, child) for child in reversed(children))
+
+    # soft_wrap skips Rich's per-line wrapping pass; the terminal wraps instead.
+    console.print(tree_view, soft_wrap=True)
+
+  # Show orphaned branches (children whose parents aren't in the current scope)
+  uuid_set = {c.uuid for c in conversations}
+  orphaned = [
+    conv
+    for conv in conversations
+    if conv.parent_uuid and conv.parent_uuid not in uuid_set
+  ]
+  if orphaned:
+    lines = ['\n[yellow]🔗 Orphaned branches (parent not in current scope):[/yellow]']
+    for conv in sorted(orphaned, key=lambda c: c.last_modified, reverse=True):
+      metadata = metadata_map.get(conv.uuid, _EMPTY_METADATA)
+      created_at = metadata.created_at or conv.last_modified
+      created_text = _format_created(created_at)
+      summary_text = _format_summary(metadata)
+      lines.append(
+        f'  [dim]└─[/dim] [cyan]{conv.uuid[:8]}...[/cyan] - parent: '
+        f'[dim]{conv.parent_uuid[:8]}...[/dim] - {created_text} - {summary_text}'
+      )
+    # One print call parses markup for the whole block at once.
+    console.print('\n'.join(lines))
+
+
 @click.group(context_settings={'help_option_names': ['-h', '--help']})
 @click.version_option()
 def main():
@@ -61,8 +177,16 @@ def main():
   is_flag=True,
   help='Show conversations in tree format (parent-child relationships)',
 )
-def list_conversations(all_projects, project_path, tree):
+@click.option(
+  '--jobs',
+  '-j',
+  type=click.IntRange(min=1),
+  default=None,
+  help='Number of threads used to read conversation files (default: auto)',
+)
+def list_conversations(all_projects, project_path, tree, jobs):
   """List available conversations."""
+  console = _console()
   try:
     manager = ClaudeConversationManager()
 
@@ -95,67 +219,21 @@ def list_conversations(all_projects, project_path, tree):
       f'[green]Found {len(conversations)} conversation(s) for {scope}[/green]\n'
     )
 
-    metadata_map = {
-      conversation.uuid: extract_conversation_metadata(conversation)
-      for conversation in conversations
-    }
+    # The tree view never shows message counts, so it can skip the full scan.
+    extract = extract_conversation_preview if tree else extract_conversation_metadata
+    metadata_map = _load_metadata(conversations, extract, jobs)
 
     if tree:
       # Show tree format
       roots, children_dict = manager.build_conversation_tree(conversations)
 
-      if roots:
-        tree_view = Tree('🌳 Conversation Tree')
-
-        def add_conversation_to_tree(parent_node, conv, children):
-          metadata = metadata_map.get(conv.uuid, ConversationMetadata())
-          created_at = metadata.created_at or conv.last_modified
-          created_text = _format_created(created_at)
-          summary_text = _format_summary(metadata)
-          branch_label = ''
-          if conv.parent_uuid:
-            branch_label = f' (branch of {conv.parent_uuid[:8]}...)'
-
-          # Create label with conversation info
-          label = (
-            f'[cyan]{conv.uuid[:8]}...[/cyan] {created_text}'
-            f'{branch_label} - {summary_text}'
-          )
-
-          conv_node = parent_node.add(label)
-
-          # Add children recursively
-          if conv.uuid in children:
-            for child in sorted(children[conv.uuid], key=lambda c: c.last_modified):
-              add_conversation_to_tree(conv_node, child, children)
-
-        # Add all root conversations
-        for root in sorted(roots, key=lambda c: c.last_modified, reverse=True):
-          add_conversation_to_tree(tree_view, root, children_dict)
-
-        console.print(tree_view)
-
-      # Show orphaned branches (children whose parents aren't in the current scope)
-      orphaned = [
-        conv
-        for conv in conversations
-        if conv.parent_uuid and conv.parent_uuid not in [c.uuid for c in conversations]
-      ]
-      if orphaned:
-        console.print(
-          '\n[yellow]🔗 Orphaned branches (parent not in current scope):[/yellow]'
-        )
-        for conv in sorted(orphaned, key=lambda c: c.last_modified, reverse=True):
-          metadata = metadata_map.get(conv.uuid, ConversationMetadata())
-          created_at = metadata.created_at or conv.last_modified
-          created_text = _format_created(created_at)
-          summary_text = _format_summary(metadata)
-          console.print(
-            f'  [dim]└─[/dim] [cyan]{conv.uuid[:8]}...[/cyan] - parent: '
-            f'[dim]{conv.parent_uuid[:8]}...[/dim] - {created_text} - {summary_text}'
-          )
+      use_pager = console.is_terminal and len(conversations) > _PAGER_THRESHOLD
+      with console.pager(styles=True) if use_pager else nullcontext():
+        _print_conversation_tree(conversations, roots, children_dict, metadata_map)
     else:
       # Show flat format
+      from rich.table import Table
+
       table = Table(show_header=True, header_style='bold blue')
       table.add_column('UUID', style='cyan')
       table.add_column('Project', style='green')
@@ -166,7 +244,7 @@ def list_conversations(all_projects, project_path, tree):
       table.add_column('Parent', style='dim')
 
       for conv in conversations:
-        metadata = metadata_map.get(conv.uuid, ConversationMetadata())
+        metadata = metadata_map.get(conv.uuid, _EMPTY_METADATA)
         created_at = metadata.created_at or conv.last_modified
         created_text = _format_created(created_at)
         summary_text = _format_summary(metadata)
@@ -201,6 +279,7 @@ def branch(session_id, target_project):
 
   Creates a copy of the conversation and sets up parent-child relationship
   for tracking conversation lineage. Use 'tree' command to view ancestry."""
+  console = _console()
   try:
     manager = ClaudeConversationManager()
 
@@ -230,6 +309,8 @@ def branch(session_id, target_project):
     console.print(f'[red]Error: {e}[/red]')
     console.print('[yellow]Matching conversations:[/yellow]')
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style='bold blue')
     table.add_column('Session ID', style='cyan')
     table.add_column('Project', style='green')
@@ -237,7 +318,7 @@ def branch(session_id, target_project):
 
     for match in e.matches:
       table.add_row(
-        match.uuid, match.project_path, match.last_modified.strftime('%Y-%m-%d %H:%M')
+        match.uuid, match.project_path, _format_timestamp(match.last_modified)
       )
 
     console.print(table)
@@ -259,6 +340,7 @@ def branch(session_id, target_project):
 @click.argument('session_id')
 def tree(session_id):
   """Show the full ancestry tree for a conversation."""
+  console = _console()
   try:
     manager = ClaudeConversationManager()
 
@@ -289,20 +371,17 @@ def tree(session_id):
         suffix = ''
 
       console.print(
-        f"{prefix} [cyan]{conv.uuid[:8]}...[/cyan] - {conv.project_path} - {conv.last_modified.strftime('%Y-%m-%d %H:%M')}{suffix}"
+        f'{prefix} [cyan]{conv.uuid[:8]}...[/cyan] - {conv.project_path} - {_format_timestamp(conv.last_modified)}{suffix}'
       )
 
     # Show children if any
-    all_conversations = manager.find_all_conversations(all_projects=True)
-    children = [
-      conv for conv in all_conversations if conv.parent_uuid == ancestry[-1].uuid
-    ]
+    children = manager.find_children_of(ancestry[-1].uuid)
 
     if children:
       console.print('\n[green]Children of current conversation:[/green]')
-      for child in sorted(children, key=lambda c: c.last_modified):
+      for child in children:
         console.print(
-          f"  └─ [cyan]{child.uuid[:8]}...[/cyan] - {child.project_path} - {child.last_modified.strftime('%Y-%m-%d %H:%M')}"
+          f'  └─ [cyan]{child.uuid[:8]}...[/cyan] - {child.project_path} - {_format_timestamp(child.last_modified)}'
         )
 
   except ConversationNotFoundError as e:
@@ -320,6 +399,7 @@ def tree(session_id):
 @main.command()
 def tui():
   """Launch the interactive TUI (Terminal User Interface)."""
+  console = _console()
   try:
     from . import tui as tui_module
 
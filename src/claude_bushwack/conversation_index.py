@@ -0,0 +1,192 @@
+"""Persistent index of per-file conversation metadata."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar
+
+from .jsonio import dump_json, load_json
+
+EntryT = TypeVar('EntryT')
+
+
+@dataclass
+class IndexEntry:
+  """Metadata remembered for one conversation file.
+
+  ``mtime_ns`` and ``size`` identify the file version the entry was read from;
+  an entry is only trusted while both still match the file on disk.
+  """
+
+  mtime_ns: int
+  size: int
+  parent_uuid: Optional[str] = None
+  project_path: Optional[str] = None
+
+
+def default_cache_dir() -> Path:
+  """Return the directory claude-bushwack uses for its own cache files."""
+  cache_home = os.environ.get('XDG_CACHE_HOME')
+  base = Path(cache_home) if cache_home else Path.home() / '.cache'
+  return base / 'claude-bushwack'
+
+
+class StatValidatedCache(Generic[EntryT]):
+  """Per-file cache entries, trusted only while the file's stat still matches.
+
+  Entries are keyed by file path, are instances of ``entry_type`` and expose
+  ``mtime_ns`` and ``size``. Subclasses convert them to and from the JSON lists
+  kept on disk. When ``path`` is ``None`` the cache only lives for the current
+  process. Lookups, stores and saves may come from several threads.
+  """
+
+  VERSION = 1
+  entry_type: Type[EntryT]
+
+  def __init__(self, path: Optional[Path] = None):
+    self.path = path
+    # Entries loaded from disk stay as their raw JSON lists until looked up, so
+    # startup does not build objects for projects the current command skips.
+    self._entries: Dict[str, Any] = {}
+    self._loaded = path is None
+    self._dirty = False
+    self._lock = threading.Lock()
+
+  def prune(self, directories: Iterable[str], seen: Iterable[str]) -> None:
+    """Forget entries inside ``directories`` whose files were not ``seen``."""
+    directory_set = set(directories)
+    seen_set = set(seen)
+    with self._lock:
+      self._ensure_loaded()
+      stale = [
+        file_path
+        for file_path in self._entries
+        if file_path not in seen_set and os.path.dirname(file_path) in directory_set
+      ]
+      for file_path in stale:
+        del self._entries[file_path]
+      if stale:
+        self._dirty = True
+
+  def save(self) -> None:
+    """Write the cache to disk if it changed. Errors are ignored."""
+    if self.path is None:
+      return
+
+    with self._lock:
+      if not self._dirty:
+        return
+      payload = {
+        'version': self.VERSION,
+        'entries': {
+          file_path: self._saved_form(entry)
+          for file_path, entry in self._entries.items()
+        },
+      }
+      self._dirty = False
+
+    try:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+      # Write to a sibling temp file and swap it in so concurrent readers
+      # never observe a partially written cache.
+      fd, tmp_name = tempfile.mkstemp(
+        dir=self.path.parent, prefix=f'.{self.path.name}.', suffix='.tmp'
+      )
+      try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+          handle.write(dump_json(payload))
+        os.replace(tmp_name, self.path)
+      except BaseException:
+        os.unlink(tmp_name)
+        raise
+    except OSError:
+      with self._lock:
+        self._dirty = True
+
+  def _lookup_entry(self, file_path: str, mtime_ns: int, size: int) -> Optional[EntryT]:
+    with self._lock:
+      self._ensure_loaded()
+      entry = self._entry_for(file_path)
+    if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+      return None
+    return entry
+
+  def _store_entry(self, file_path: str, entry: EntryT) -> None:
+    with self._lock:
+      self._ensure_loaded()
+      if self._entry_for(file_path) != entry:
+        self._entries[file_path] = entry
+        self._dirty = True
+
+  def _saved_form(self, entry: Any) -> Any:
+    # Entries never looked up are still in the form they were loaded in.
+    if isinstance(entry, self.entry_type):
+      return self._encode_entry(entry)
+    return entry
+
+  def _encode_entry(self, entry: EntryT) -> List:
+    raise NotImplementedError
+
+  def _decode_entry(self, raw: List) -> EntryT:
+    """Build an entry from its saved list; raise TypeError or ValueError."""
+    raise NotImplementedError
+
+  def _ensure_loaded(self) -> None:
+    if self._loaded:
+      return
+    self._loaded = True
+
+    try:
+      with open(self.path, 'rb') as handle:
+        payload = load_json(handle.read())
+    except (OSError, ValueError):
+      return
+
+    if not isinstance(payload, dict) or payload.get('version') != self.VERSION:
+      return
+
+    entries = payload.get('entries')
+    if isinstance(entries, dict):
+      self._entries = entries
+
+  def _entry_for(self, file_path: str) -> Optional[EntryT]:
+    entry = self._entries.get(file_path)
+    if entry is None or isinstance(entry, self.entry_type):
+      return entry
+
+    try:
+      decoded = self._decode_entry(entry)
+    except (TypeError, ValueError):
+      del self._entries[file_path]
+      return None
+    self._entries[file_path] = decoded
+    return decoded
+
+
+class ConversationIndex(StatValidatedCache[IndexEntry]):
+  """Stat-validated cache of conversation metadata, optionally saved to disk.
+
+  Entries are keyed by the conversation file path.
+  """
+
+  entry_type = IndexEntry
+
+  def lookup(self, file_path: str, mtime_ns: int, size: int) -> Optional[IndexEntry]:
+    """Return the entry for ``file_path`` if it matches the given stat values."""
+    return self._lookup_entry(file_path, mtime_ns, size)
+
+  def store(self, file_path: str, entry: IndexEntry) -> None:
+    self._store_entry(file_path, entry)
+
+  def _encode_entry(self, entry: IndexEntry) -> List:
+    return [entry.mtime_ns, entry.size, entry.parent_uuid, entry.project_path]
+
+  def _decode_entry(self, raw: List) -> IndexEntry:
+    mtime_ns, size, parent_uuid, project_path = raw
+    return IndexEntry(
+      mtime_ns=mtime_ns, size=size, parent_uuid=parent_uuid, project_path=project_path
+    )
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, List, NamedTuple, Optional, Union
 
+from .conversation_index import StatValidatedCache
 from .core import ConversationFile
+from .jsonio import load_json
 
 
 @dataclass
@@ -24,68 +29,224 @@ class ConversationMetadata:
 
 ConversationSource = Union[ConversationFile, Path, str]
 
+# Parsed results are memoized by (path, mtime, size); Claude only ever appends
+# to transcripts, so an unchanged stat means an unchanged parse. Cached
+# ConversationMetadata instances are shared and must not be mutated.
+_METADATA_CACHE_SIZE = 4096
 
-def extract_conversation_metadata(source: ConversationSource) -> ConversationMetadata:
-  """Parse the conversation file and return metadata for display/use."""
+# Matching leading whitespace with the regex avoids copying the whole message
+# the way ``str.lstrip`` would; previews can be very long pasted text.
+_SESSION_HOOK_PATTERN = re.compile(r'\s*<session-start-hook>')
+
+
+def extract_conversation_metadata(
+  source: ConversationSource, *, preview_chars: Optional[int] = None
+) -> ConversationMetadata:
+  """Parse the conversation file and return metadata for display/use.
+
+  With ``preview_chars``, message text is only collected up to that many
+  characters, so callers that show a truncated preview skip joining huge
+  pasted messages in full.
+  """
+  return _cached_scan(source, count_messages=True, preview_chars=preview_chars)
+
+
+def extract_conversation_preview(
+  source: ConversationSource, *, preview_chars: Optional[int] = None
+) -> ConversationMetadata:
+  """Return display metadata without counting messages.
+
+  Reading stops as soon as the summary, preview, creation timestamp, and git
+  branch are known, so long transcripts only pay for their first few records.
+  The returned ``message_count`` is always ``0``. ``preview_chars`` works as in
+  :func:`extract_conversation_metadata`.
+  """
+  return _cached_scan(source, count_messages=False, preview_chars=preview_chars)
+
+
+def extract_conversation_message_count(source: ConversationSource) -> int:
+  """Count the message records in the conversation file."""
+  return extract_conversation_metadata(source).message_count
+
+
+def clear_metadata_cache() -> None:
+  """Drop all memoized metadata results."""
+  _scan_conversation_at.cache_clear()
+
+
+class _CacheEntry(NamedTuple):
+  """Metadata for one file in a MetadataCache, with the stat it was read at."""
+
+  mtime_ns: int
+  size: int
+  metadata: ConversationMetadata
+
+
+class MetadataCache(StatValidatedCache[_CacheEntry]):
+  """Stat-validated conversation metadata, saved between runs.
+
+  A warm start stats files instead of parsing them.
+  """
+
+  entry_type = _CacheEntry
+
+  def lookup(
+    self, file_path: str, mtime_ns: int, size: int
+  ) -> Optional[ConversationMetadata]:
+    """Return the metadata for ``file_path`` if it matches the stat values."""
+    entry = self._lookup_entry(file_path, mtime_ns, size)
+    return entry.metadata if entry is not None else None
+
+  def store(
+    self, file_path: str, mtime_ns: int, size: int, metadata: ConversationMetadata
+  ) -> None:
+    self._store_entry(file_path, _CacheEntry(mtime_ns, size, metadata))
+
+  def _encode_entry(self, entry: _CacheEntry) -> List:
+    metadata = entry.metadata
+    created_at = metadata.created_at
+    return [
+      entry.mtime_ns,
+      entry.size,
+      metadata.preview,
+      metadata.summary,
+      created_at.isoformat() if created_at is not None else None,
+      metadata.message_count,
+      metadata.git_branch,
+    ]
+
+  def _decode_entry(self, raw: List) -> _CacheEntry:
+    mtime_ns, size, preview, summary, created_at, message_count, git_branch = raw
+    metadata = ConversationMetadata(
+      preview=preview,
+      summary=summary,
+      created_at=_parse_timestamp(created_at),
+      message_count=message_count,
+      git_branch=git_branch,
+    )
+    return _CacheEntry(mtime_ns, size, metadata)
+
+
+def _cached_scan(
+  source: ConversationSource, *, count_messages: bool, preview_chars: Optional[int]
+) -> ConversationMetadata:
   path = _coerce_path(source)
+  if (
+    isinstance(source, ConversationFile)
+    and source.mtime_ns is not None
+    and source.size is not None
+  ):
+    # Discovery already stat'ed the file; reuse that as the cache key.
+    mtime_ns, size = source.mtime_ns, source.size
+  else:
+    try:
+      stat_result = os.stat(path)
+    except OSError:
+      return ConversationMetadata()
+    mtime_ns, size = stat_result.st_mtime_ns, stat_result.st_size
+  return _scan_conversation_at(str(path), mtime_ns, size, count_messages, preview_chars)
+
+
+@lru_cache(maxsize=_METADATA_CACHE_SIZE)
+def _scan_conversation_at(
+  path: str,
+  mtime_ns: int,
+  size: int,
+  count_messages: bool,
+  preview_chars: Optional[int],
+) -> ConversationMetadata:
+  # mtime_ns and size are only part of the cache key.
+  del mtime_ns, size
+  return _scan_conversation(
+    Path(path), count_messages=count_messages, preview_chars=preview_chars
+  )
+
 
+def _scan_conversation(
+  path: Path, *, count_messages: bool, preview_chars: Optional[int]
+) -> ConversationMetadata:
   summary = ''
   preview = ''
   created_at: Optional[datetime] = None
   git_branch: Optional[str] = None
   message_count = 0
 
+  # Bind hot names locally; this loop runs once per transcript line.
+  loads = load_json
+  header_complete = False
+  offset = 0
+
   try:
-    with open(path, 'r', encoding='utf-8') as handle:
+    with open(path, 'rb', buffering=65536) as handle:
       for line_number, raw_line in enumerate(handle):
-        line = raw_line.strip()
-        if not line:
+        if header_complete:
+          if count_messages:
+            message_count += _count_message_records(handle, offset)
+          break
+        offset += len(raw_line)
+
+        if not raw_line.strip():
+          continue
+
+        # A line can only contribute if it mentions a key we still need, so
+        # cheap substring checks on the raw bytes avoid most JSON parses.
+        if line_number > 0 and not (
+          (count_messages and b'"message"' in raw_line)
+          or (created_at is None and b'"timestamp"' in raw_line)
+          or (git_branch is None and b'"gitBranch"' in raw_line)
+          or (not preview and b'"user"' in raw_line)
+        ):
           continue
 
         try:
-          data = json.loads(line)
-        except json.JSONDecodeError:
+          data = loads(raw_line)
+        except ValueError:
+          continue
+
+        if type(data) is not dict:
           continue
 
-        if line_number == 0 and data.get('type') == 'summary':
-          summary_value = data.get('summary')
+        get = data.get
+        message = get('message')
+
+        if line_number == 0 and get('type') == 'summary':
+          summary_value = get('summary')
           if isinstance(summary_value, str):
             summary = summary_value
           continue
 
         if created_at is None:
-          timestamp_value = data.get('timestamp')
-          parsed_timestamp = _parse_timestamp(timestamp_value)
+          parsed_timestamp = _parse_timestamp(get('timestamp'))
           if parsed_timestamp is not None:
             created_at = parsed_timestamp
 
         if git_branch is None:
-          branch_value = data.get('gitBranch')
+          branch_value = get('gitBranch')
           if isinstance(branch_value, str):
             branch_stripped = branch_value.strip()
             if branch_stripped:
               git_branch = branch_stripped
 
-        message = data.get('message')
         if isinstance(message, dict):
           message_count += 1
           if (
-            not preview
-            and message.get('role') == 'user'
-            and data.get('isMeta') is not True
+            not preview and message.get('role') == 'user' and get('isMeta') is not True
           ):
-            text = _coerce_text(message)
+            text = _coerce_text(message, preview_chars)
+            if text and not _is_session_hook(text):
+              preview = text
+        else:
+          if get('role') == 'user' and not preview:
+            text = _coerce_text(data, preview_chars)
             if text and not _is_session_hook(text):
               preview = text
-          continue
 
-        if data.get('role') == 'user' and not preview:
-          text = _coerce_text(data)
-          if text and not _is_session_hook(text):
-            preview = text
+          if 'message' in data:
+            message_count += 1
 
-        if 'message' in data and not isinstance(message, dict):
-          message_count += 1
+        header_complete = (
+          bool(preview) and created_at is not None and git_branch is not None
+        )
   except OSError:
     return ConversationMetadata()
 
@@ -93,11 +254,57 @@ def extract_conversation_metadata(source: ConversationSource) -> ConversationMet
     preview=preview,
     summary=summary,
     created_at=created_at,
-    message_count=message_count,
+    message_count=message_count if count_messages else 0,
     git_branch=git_branch,
   )
 
 
+def _count_message_records(handle: BinaryIO, start: int) -> int:
+  """Count records with a top-level ``message`` key from byte ``start`` on.
+
+  The file is memory-mapped and searched for ``"message"`` directly, so lines
+  that never mention the key are skipped without being copied into Python
+  objects; only the lines around each hit are decoded.
+  """
+  try:
+    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+  except (OSError, ValueError):
+    # Not mappable (special files, some network filesystems): read lines.
+    handle.seek(start)
+    return sum(
+      1
+      for raw_line in handle
+      if b'"message"' in raw_line and _is_message_record(raw_line)
+    )
+
+  count = 0
+  position = start
+  with mapped:
+    find = mapped.find
+    size = len(mapped)
+    while True:
+      hit = find(b'"message"', position)
+      if hit < 0:
+        break
+      # ``position`` always sits at the start of a line.
+      line_start = max(position, mapped.rfind(b'\n', position, hit) + 1)
+      line_end = find(b'\n', hit)
+      if line_end < 0:
+        line_end = size
+      if _is_message_record(mapped[line_start:line_end]):
+        count += 1
+      position = line_end + 1
+  return count
+
+
+def _is_message_record(raw_line: bytes) -> bool:
+  try:
+    data = load_json(raw_line)
+  except ValueError:
+    return False
+  return type(data) is dict and 'message' in data
+
+
 def _coerce_path(source: ConversationSource) -> Path:
   if isinstance(source, ConversationFile):
     return source.path
@@ -123,17 +330,30 @@ def _parse_timestamp(value: object) -> Optional[datetime]:
     return None
 
 
-def _coerce_text(message: dict) -> str:
+def _coerce_text(message: dict, max_chars: Optional[int] = None) -> str:
+  """Return the text of ``message``, cut to ``max_chars`` unless it is ``None``.
+
+  Segment collection stops once enough text is gathered, so huge multi-part
+  messages are not joined in full just to be truncated afterwards.
+  """
   if not isinstance(message, dict):
     return ''
 
   content = message.get('content')
+  # Plain string content is the common case; return it before the list walk.
+  if isinstance(content, str):
+    return _cap(content, max_chars)
+
   segments: list[str] = []
+  collected = 0
 
   if isinstance(content, list):
     for item in content:
+      if max_chars is not None and collected >= max_chars:
+        break
       if isinstance(item, str):
         segments.append(item)
+        collected += len(item) + 1
         continue
       if not isinstance(item, dict):
         continue
@@ -141,41 +361,49 @@ def _coerce_text(message: dict) -> str:
         text_value = item.get('text')
         if isinstance(text_value, str):
           segments.append(text_value)
+          collected += len(text_value) + 1
           continue
       text_value = item.get('text') or item.get('content')
       if isinstance(text_value, str):
         segments.append(text_value)
+        collected += len(text_value) + 1
     if segments:
-      return ' '.join(segments)
-
-  if isinstance(content, str):
-    return content
+      return _cap(' '.join(segments), max_chars)
 
   text_field = message.get('text')
   if isinstance(text_field, str):
-    return text_field
+    return _cap(text_field, max_chars)
   if isinstance(text_field, dict):
     inner_text = text_field.get('text')
     if isinstance(inner_text, str):
-      return inner_text
+      return _cap(inner_text, max_chars)
   if isinstance(text_field, list):
     for item in text_field:
+      if max_chars is not None and collected >= max_chars:
+        break
       if isinstance(item, str):
         segments.append(item)
+        collected += len(item) + 1
       elif isinstance(item, dict):
         segment_text = item.get('text') or item.get('content')
         if isinstance(segment_text, str):
           segments.append(segment_text)
+          collected += len(segment_text) + 1
     if segments:
-      return ' '.join(segments)
+      return _cap(' '.join(segments), max_chars)
 
   body = message.get('body')
   if isinstance(body, str):
-    return body
+    return _cap(body, max_chars)
 
   return ''
 
 
+def _cap(text: str, max_chars: Optional[int]) -> str:
+  if max_chars is None or len(text) <= max_chars:
+    return text
+  return text[:max_chars]
+
+
 def _is_session_hook(text: str) -> bool:
-  stripped = text.lstrip()
-  return stripped.startswith('<session-start-hook>')
+  return _SESSION_HOOK_PATTERN.match(text) is not None
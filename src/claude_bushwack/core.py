@@ -1,24 +1,163 @@
 """Core functionality for claude-bushwack."""
 
+import errno
 import json
+import os
 import re
 import shutil
+import sys
+import tempfile
 import uuid as uuid_module
-from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .conversation_index import ConversationIndex, IndexEntry, default_cache_dir
 from .exceptions import (
   AmbiguousSessionIDError,
   BranchingError,
   ConversationNotFoundError,
   InvalidUUIDError,
 )
+from .jsonio import dump_json, load_json
 
+_UUID_JSONL_PATTERN = re.compile(
+  r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.jsonl'
+)
+_SESSION_ID_PATTERN = re.compile(r'[0-9a-f-]+')
+# Claude Code writes parentUuid as the first key of each record, so the value
+# can usually be read off the start of the line without decoding the rest.
+_LEADING_PARENT_UUID_PATTERN = re.compile(
+  rb'\{\s*"parentUuid"\s*:\s*(?:null|"([0-9a-f-]{36})")\s*[,}]'
+)
+_FULL_UUID_PATTERN = re.compile(
+  r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+)
+
+_FIRST_LINE_READ_SIZE = 4096
+_COPY_CHUNK_SIZE = 1 << 20
+_LONG_LINE_READ_SIZE = 65536
+_KERNEL_COPY_SIZE = 1 << 30
+
+# copy_file_range errors that mean "not supported here", not a failed copy.
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+  {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+# Unindexed files are read on a thread pool once there are more than this many.
+_PARALLEL_READ_THRESHOLD = 4
+
+
+def _read_first_line(path: Path) -> bytes:
+  """Return the first line of ``path`` without its newline.
+
+  The file is read through a raw descriptor, so a typical first line costs one
+  ``open``, one ``read`` and one ``close``; longer lines are read in larger
+  chunks until the newline turns up.
+  """
+  fd = os.open(path, os.O_RDONLY)
+  try:
+    chunk = os.read(fd, _FIRST_LINE_READ_SIZE)
+    newline = chunk.find(b'\n')
+    if newline != -1:
+      return chunk[:newline]
+    if len(chunk) < _FIRST_LINE_READ_SIZE:
+      return chunk
+
+    parts = [chunk]
+    while True:
+      chunk = os.read(fd, _LONG_LINE_READ_SIZE)
+      if not chunk:
+        break
+      newline = chunk.find(b'\n')
+      if newline != -1:
+        parts.append(chunk[:newline])
+        break
+      parts.append(chunk)
+    return b''.join(parts)
+  finally:
+    os.close(fd)
+
+
+def _replace_first_line(path: Path, first_line: str) -> None:
+  """Replace the first line of ``path`` with ``first_line``.
+
+  The rest of the file is streamed in chunks into a sibling temporary file,
+  which then replaces the original, so large transcripts are never held in
+  memory and readers never see a half-written file.
+  """
+  fd, tmp_name = tempfile.mkstemp(
+    dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp'
+  )
+  try:
+    with open(path, 'rb') as source, os.fdopen(fd, 'wb') as target:
+      source.readline()
+      target.write(first_line.encode('utf-8') + b'\n')
+      shutil.copyfileobj(source, target, _COPY_CHUNK_SIZE)
+    shutil.copymode(path, tmp_name)
+    os.replace(tmp_name, path)
+  except BaseException:
+    try:
+      os.unlink(tmp_name)
+    except OSError:
+      pass
+    raise
+
+
+def _copy_file(source: Path, target: Path, first_line: Optional[str] = None) -> None:
+  """Copy ``source`` to ``target`` along with its permission bits.
+
+  ``first_line``, when given, takes the place of the source's first line. The
+  copy is a new file, so it gets a fresh modification time. Where
+  ``os.copy_file_range`` exists (Linux) the copied bytes never leave the
+  kernel, and filesystems that support it can share extents instead of copying.
+  When the call is unavailable or refused, the data is streamed in chunks.
+  """
+  with open(source, 'rb') as src, open(target, 'wb') as dst:
+    offset = 0
+    if first_line is not None:
+      offset = len(src.readline())
+      dst.write(first_line.encode('utf-8') + b'\n')
+      dst.flush()
+    dst_start = dst.tell()
+    if not _kernel_copy(src.fileno(), dst.fileno(), offset):
+      src.seek(offset)
+      dst.seek(dst_start)
+      dst.truncate()
+      shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+  shutil.copymode(source, target)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, offset: int) -> bool:
+  """Copy ``src_fd`` from ``offset`` onwards to ``dst_fd`` inside the kernel.
+
+  Returns ``False`` when ``os.copy_file_range`` is unavailable or refused.
+  """
+  copy_file_range = getattr(os, 'copy_file_range', None)
+  if copy_file_range is None:
+    return False
+  try:
+    while True:
+      copied = copy_file_range(src_fd, dst_fd, _KERNEL_COPY_SIZE, offset)
+      if not copied:
+        return True
+      offset += copied
+  except OSError as error:
+    if error.errno not in _KERNEL_COPY_UNSUPPORTED:
+      raise
+    return False
+
+
+# Slotted dataclasses need Python 3.10; older interpreters keep a __dict__.
+_DATACLASS_SLOTS: Dict[str, bool] = (
+  {'slots': True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConversationFile:
   """Represents a Claude conversation file."""
 
@@ -28,6 +167,10 @@ class ConversationFile:
   project_path: str
   last_modified: datetime
   parent_uuid: Optional[str] = None
+  # File stat values observed when the conversation was discovered, if known.
+  # Metadata extraction reuses them as its cache key instead of re-stat'ing.
+  mtime_ns: Optional[int] = field(default=None, compare=False, repr=False)
+  size: Optional[int] = field(default=None, compare=False, repr=False)
 
 
 class ClaudeConversationManager:
@@ -51,21 +194,42 @@ class ClaudeConversationManager:
     'projectRoot',
     'workingDirectory',
   )
-  _PROJECT_PATH_FIELD_TOKENS: Tuple[str, ...] = tuple(
-    f'"{field}"' for field in _PROJECT_PATH_FIELDS
+  # One scan per line for any of the quoted field names above.
+  _PROJECT_PATH_FIELD_PATTERN: 're.Pattern[bytes]' = re.compile(
+    b'"(?:' + b'|'.join(re.escape(f.encode()) for f in _PROJECT_PATH_FIELDS) + b')"'
   )
   _METADATA_SCAN_LINE_LIMIT: int = 50
 
-  def __init__(self, claude_projects_dir: Optional[Path] = None):
+  def __init__(
+    self, claude_projects_dir: Optional[Path] = None, index_path: Optional[Path] = None
+  ):
     if claude_projects_dir is None:
       claude_projects_dir = Path.home() / '.claude' / 'projects'
+      # Only persist the index for the real Claude directory; custom roots
+      # (tests, scripting) keep it in memory unless a path is given.
+      if index_path is None:
+        index_path = default_cache_dir() / 'index.json'
     self.claude_projects_dir = claude_projects_dir
+    # parentUuid/project path per file, validated against (mtime, size) so
+    # unchanged transcripts are not re-read on every invocation.
+    self._index = ConversationIndex(index_path)
     # Remember the original path we encoded for each project token so we can
     # reliably decode hyphenated segments later in the session.
     # Note: Not thread-safe; intended for single-threaded CLI/TUI usage.
     # No eviction strategy: CLI processes are short-lived, and even 1000 projects
     # only consume ~50KB memory (negligible for typical usage patterns).
     self._project_dir_cache: Dict[str, str] = {}
+    # Detected git branch per project path, keyed on the HEAD file's mtime so a
+    # checkout in a long-running TUI session is still picked up.
+    self._git_branch_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+    # Project directories this manager has already created or found, so
+    # repeated branches into one project skip the mkdir walk.
+    self._known_project_dirs: set[str] = set()
+
+  @property
+  def index_path(self) -> Optional[Path]:
+    """Where the conversation index is saved, or ``None`` if kept in memory."""
+    return self._index.path
 
   def _path_to_project_dir(self, path: Path) -> str:
     """Convert filesystem path to Claude project directory name."""
@@ -86,12 +250,13 @@ class ClaudeConversationManager:
       return Path(cached_path)
 
     # Try to recover the real path from JSONL metadata inside the directory.
-    project_dir_path = self.claude_projects_dir / project_dir
-    if project_dir_path.exists() and project_dir_path.is_dir():
-      project_path = self._get_project_path_from_dir(project_dir_path)
-      if project_path:
-        self._project_dir_cache[project_dir] = project_path
-        return Path(project_path)
+    # Missing directories are handled by the scan itself.
+    project_path = self._get_project_path_from_dir(
+      self.claude_projects_dir / project_dir
+    )
+    if project_path:
+      self._project_dir_cache[project_dir] = project_path
+      return Path(project_path)
 
     # Fallback to the legacy lossy transformation so we always return a value.
     path_str = project_dir.replace('--', '-.')
@@ -108,61 +273,91 @@ class ClaudeConversationManager:
   def _get_parent_uuid(self, conversation_file: Path) -> Optional[str]:
     """Extract parentUuid from the first line of a JSONL conversation file."""
     try:
-      with open(conversation_file, 'r') as f:
-        first_line = f.readline().strip()
-        if first_line:
-          data = json.loads(first_line)
-          parent_uuid = data.get('parentUuid')
-          return parent_uuid if parent_uuid else None
-      return None
-    except (OSError, json.JSONDecodeError):
+      return self._parse_parent_uuid(_read_first_line(conversation_file))
+    except OSError:
       return None
 
   def _get_project_path_from_jsonl(self, conversation_file: Path) -> Optional[str]:
     """Extract project path from JSONL conversation file metadata."""
 
     try:
-      with open(conversation_file, 'r') as f:
-        for _ in range(self._METADATA_SCAN_LINE_LIMIT):
-          line = f.readline()
-          if not line:
-            break
-
-          stripped = line.strip()
-          if not stripped:
-            continue
-
-          if not any(token in stripped for token in self._PROJECT_PATH_FIELD_TOKENS):
-            continue
+      with open(conversation_file, 'rb', buffering=65536) as f:
+        return self._scan_project_path(islice(f, self._METADATA_SCAN_LINE_LIMIT))
+    except OSError:
+      return None
 
-          try:
-            data = json.loads(stripped)
-          except json.JSONDecodeError:
-            continue
+  def _read_head_metadata(
+    self, conversation_file: Path
+  ) -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(parent_uuid, project_path)`` from one pass over the file head.
 
-          if not isinstance(data, dict):
-            continue
+    Equivalent to calling :meth:`_get_parent_uuid` and
+    :meth:`_get_project_path_from_jsonl`, but opens and reads the file once.
+    """
+    try:
+      with open(conversation_file, 'rb', buffering=65536) as f:
+        first_line = f.readline()
+        if not first_line:
+          return None, None
+        parent_uuid = self._parse_parent_uuid(first_line)
+        project_path = self._scan_project_path(
+          chain((first_line,), islice(f, self._METADATA_SCAN_LINE_LIMIT - 1))
+        )
+    except OSError:
+      return None, None
+    return parent_uuid, project_path
 
-          project_path = self._extract_project_path_from_dict(data)
-          if project_path:
-            return project_path
+  @staticmethod
+  def _parse_parent_uuid(first_line: bytes) -> Optional[str]:
+    first_line = first_line.strip()
+    if not first_line:
       return None
-    except OSError:
+    match = _LEADING_PARENT_UUID_PATTERN.match(first_line)
+    if match is not None:
+      parent_uuid = match.group(1)
+      return parent_uuid.decode('ascii') if parent_uuid else None
+    try:
+      data = load_json(first_line)
+    except ValueError:
       return None
+    if not isinstance(data, dict):
+      return None
+    parent_uuid = data.get('parentUuid')
+    return parent_uuid if parent_uuid else None
+
+  @classmethod
+  def _scan_project_path(cls, lines: Iterable[bytes]) -> Optional[str]:
+    """Return the first project path found in ``lines`` of JSONL."""
+    for line in lines:
+      if not cls._PROJECT_PATH_FIELD_PATTERN.search(line):
+        continue
+
+      try:
+        data = load_json(line)
+      except ValueError:
+        continue
+
+      if not isinstance(data, dict):
+        continue
+
+      project_path = cls._extract_project_path_from_dict(data)
+      if project_path:
+        return project_path
+    return None
 
   @classmethod
   def _extract_project_path_from_dict(cls, data: Dict[str, Any]) -> Optional[str]:
     """Return the first valid project path from known metadata fields."""
 
-    for field in cls._PROJECT_PATH_FIELDS:
-      value = cls._coerce_project_path(data.get(field))
+    for field_name in cls._PROJECT_PATH_FIELDS:
+      value = cls._coerce_project_path(data.get(field_name))
       if value:
         return value
 
     metadata = data.get('metadata')
     if isinstance(metadata, dict):
-      for field in cls._PROJECT_PATH_FIELDS:
-        value = cls._coerce_project_path(metadata.get(field))
+      for field_name in cls._PROJECT_PATH_FIELDS:
+        value = cls._coerce_project_path(metadata.get(field_name))
         if value:
           return value
 
@@ -188,12 +383,13 @@ class ClaudeConversationManager:
         Project path string if found, None otherwise
     """
     try:
-      for file_path in directory.iterdir():
-        if not file_path.is_file() or file_path.suffix != '.jsonl':
-          continue
-        project_path = self._get_project_path_from_jsonl(file_path)
-        if project_path:
-          return project_path
+      with os.scandir(directory) as entries:
+        for dir_entry in entries:
+          if not dir_entry.name.endswith('.jsonl') or not dir_entry.is_file():
+            continue
+          project_path = self._get_project_path_from_jsonl(Path(dir_entry.path))
+          if project_path:
+            return project_path
     except (OSError, PermissionError):
       pass
     return None
@@ -202,44 +398,52 @@ class ClaudeConversationManager:
     self, conversation_file: Path, parent_uuid: str
   ) -> None:
     """Set the parentUuid in the first line of a JSONL conversation file."""
-    try:
-      # Read the file
-      with open(conversation_file, 'r') as f:
-        first_line = f.readline()
-        rest_of_file = f.read()
-
-      # Parse and modify the first line
-      data = json.loads(first_line)
-      data['parentUuid'] = parent_uuid
-
-      # Write back to file
-      with open(conversation_file, 'w') as f:
-        f.write(json.dumps(data) + '\n')
-        f.write(rest_of_file)
-    except (OSError, json.JSONDecodeError) as e:
-      raise BranchingError(f'Failed to set parentUuid in JSONL file: {e}', e)
+    first_line = self._reparented_first_line(conversation_file, parent_uuid)
+    if first_line is not None:
+      self._write_first_line(conversation_file, first_line)
 
   def _clear_parent_uuid_in_jsonl(self, conversation_file: Path) -> None:
     """Remove the parentUuid from the first line of a JSONL conversation file."""
+    first_line = self._reparented_first_line(conversation_file, None)
+    if first_line is not None:
+      self._write_first_line(conversation_file, first_line)
+
+  def _reparented_first_line(
+    self, conversation_file: Path, parent_uuid: Optional[str]
+  ) -> Optional[str]:
+    """Return the first line with parentUuid set, or removed when ``None``.
+
+    Returns ``None`` when the line needs no change.
+
+    Raises:
+        BranchingError: If the first line cannot be read or decoded
+    """
+    action = 'set' if parent_uuid else 'clear'
     try:
-      with open(conversation_file, 'r') as f:
+      with open(conversation_file, 'rb') as f:
         first_line = f.readline()
-        rest_of_file = f.read()
 
-      if not first_line:
-        return
+      if not parent_uuid and not first_line:
+        return None
 
-      data = json.loads(first_line)
-      if 'parentUuid' not in data:
-        return
+      data = load_json(first_line)
+    except (OSError, json.JSONDecodeError) as e:
+      raise BranchingError(f'Failed to {action} parentUuid in JSONL file: {e}', e)
 
-      data.pop('parentUuid', None)
+    if parent_uuid:
+      data['parentUuid'] = parent_uuid
+    elif 'parentUuid' in data:
+      data.pop('parentUuid')
+    else:
+      return None
+    return dump_json(data)
 
-      with open(conversation_file, 'w') as f:
-        f.write(json.dumps(data) + '\n')
-        f.write(rest_of_file)
-    except (OSError, json.JSONDecodeError) as e:
-      raise BranchingError(f'Failed to clear parentUuid in JSONL file: {e}', e)
+  @staticmethod
+  def _write_first_line(conversation_file: Path, first_line: str) -> None:
+    try:
+      _replace_first_line(conversation_file, first_line)
+    except OSError as e:
+      raise BranchingError(f'Failed to update parentUuid in JSONL file: {e}', e)
 
   def find_all_conversations(
     self,
@@ -257,86 +461,250 @@ class ClaudeConversationManager:
     Returns:
         List of ConversationFile objects sorted by last_modified (newest first)
     """
-    if not self.claude_projects_dir.exists():
-      return []
+    target_project_dirs = self._resolve_target_project_dirs(
+      project_filter, current_project_only, all_projects
+    )
 
     conversations = []
-    uuid_pattern = re.compile(
-      r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.jsonl$'
+    for file_path, project_dir_name, entry in self._resolve_index_entries(
+      self._iter_conversation_files(target_project_dirs)
+    ):
+      try:
+        conversations.append(
+          self._load_conversation(Path(file_path), project_dir_name, entry=entry)
+        )
+      except (OSError, PermissionError):
+        # Skip files we can't access
+        continue
+
+    self._index.prune(
+      (str(self.claude_projects_dir / name) for name in target_project_dirs),
+      (str(conversation.path) for conversation in conversations),
     )
+    self._index.save()
+
+    # Sort by last modified time (newest first). Every loaded conversation
+    # carries its raw mtime, which compares faster than the datetime.
+    conversations.sort(key=attrgetter('mtime_ns'), reverse=True)
+    return conversations
+
+  def find_children_of(self, parent_uuid: str) -> List[ConversationFile]:
+    """Find the direct children of a conversation across all projects.
+
+    Branches can live in any project, so every project directory is visited,
+    but only the first line of each file is read to check its parentUuid.
+    Files already in the index are not read at all. A directory's project path
+    is resolved once for the index whenever it holds a file that has to be
+    read.
+
+    Args:
+        parent_uuid: Full UUID of the parent conversation
+
+    Returns:
+        List of ConversationFile objects sorted by last_modified (oldest first)
+    """
+    target_project_dirs = self._resolve_target_project_dirs(None, False, True)
+
+    children = []
+    for file_path, project_dir_name, entry in self._resolve_index_entries(
+      self._iter_conversation_files(target_project_dirs)
+    ):
+      if entry.parent_uuid != parent_uuid:
+        continue
+      try:
+        children.append(
+          self._load_conversation(Path(file_path), project_dir_name, entry=entry)
+        )
+      except (OSError, PermissionError):
+        continue
+    self._index.save()
+
+    children.sort(key=attrgetter('mtime_ns'))
+    return children
 
-    # Determine which project directories to search
+  def _resolve_target_project_dirs(
+    self, project_filter: Optional[str], current_project_only: bool, all_projects: bool
+  ) -> List[str]:
+    """Return the project directory names a conversation search should visit.
+
+    Names are not checked for existence here: listing a missing directory
+    fails inside ``_iter_conversation_files`` and is skipped there, so a
+    separate ``stat`` per directory would only repeat that work.
+    """
     target_project_dirs = []
 
     if all_projects:
       # Search all project directories
-      for project_dir in self.claude_projects_dir.iterdir():
-        if project_dir.is_dir():
-          target_project_dirs.append(project_dir.name)
+      try:
+        with os.scandir(self.claude_projects_dir) as entries:
+          for project_dir in entries:
+            if project_dir.is_dir():
+              target_project_dirs.append(project_dir.name)
+      except OSError:
+        return []
     elif project_filter:
       # Search specific project directory
-      project_dir_name = self._path_to_project_dir(Path(project_filter))
-      if (self.claude_projects_dir / project_dir_name).exists():
-        target_project_dirs.append(project_dir_name)
+      target_project_dirs.append(self._path_to_project_dir(Path(project_filter)))
     elif current_project_only:
       # Search current project only
       current_project_dir = self._get_current_project_dir()
-      if (
-        current_project_dir
-        and (self.claude_projects_dir / current_project_dir).exists()
-      ):
+      if current_project_dir:
         target_project_dirs.append(current_project_dir)
 
-    # Collect conversation files from target directories
-    for project_dir_name in target_project_dirs:
-      project_dir_path = self.claude_projects_dir / project_dir_name
+    return target_project_dirs
 
-      try:
-        if not project_dir_path.exists() or not project_dir_path.is_dir():
-          continue
+  def _iter_conversation_files(
+    self, project_dir_names: List[str], *, name_prefix: str = ''
+  ) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """Yield ``(file_path, project_dir_name, stat_result)`` per conversation file.
 
-        for file_path in project_dir_path.iterdir():
-          try:
-            if file_path.is_file() and uuid_pattern.match(file_path.name):
-              uuid = file_path.stem
-
-              # Try to get project path from JSONL metadata first
-              project_path_from_metadata = self._get_project_path_from_jsonl(file_path)
-              if project_path_from_metadata:
-                project_path = project_path_from_metadata
-              else:
-                # Fallback to reconstructing from directory name (may be incorrect for paths with hyphens)
-                project_path = str(self._project_dir_to_path(project_dir_name))
-
-              # Get file modification time safely
-              try:
-                last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
-              except (OSError, OverflowError):
-                # Fallback to current time if stat fails
-                last_modified = datetime.now()
-
-              # Get parent UUID from JSONL file
-              parent_uuid = self._get_parent_uuid(file_path)
-
-              conversation = ConversationFile(
-                path=file_path,
-                uuid=uuid,
-                project_dir=project_dir_name,
-                project_path=project_path,
-                last_modified=last_modified,
-                parent_uuid=parent_uuid,
-              )
-              conversations.append(conversation)
-          except (OSError, PermissionError):
-            # Skip files we can't access
-            continue
+    Only the named project directories are listed, and only files whose names
+    start with ``name_prefix`` are yielded. ``os.scandir`` reports the entry
+    type without a separate ``stat`` call per file, and the returned stat
+    result is reused for the index lookup. Paths are yielded as plain strings;
+    callers build a ``Path`` only for the files they keep.
+    """
+    projects_dir = str(self.claude_projects_dir)
+    for project_dir_name in project_dir_names:
+      project_dir_path = os.path.join(projects_dir, project_dir_name)
+
+      try:
+        with os.scandir(project_dir_path) as entries:
+          for dir_entry in entries:
+            try:
+              name = dir_entry.name
+              if (
+                name.startswith(name_prefix)
+                and _UUID_JSONL_PATTERN.fullmatch(name)
+                and dir_entry.is_file()
+              ):
+                yield dir_entry.path, project_dir_name, dir_entry.stat()
+            except (OSError, PermissionError):
+              # Skip files we can't access
+              continue
       except (OSError, PermissionError):
         # Skip directories we can't access
         continue
 
-    # Sort by last modified time (newest first)
-    conversations.sort(key=lambda c: c.last_modified, reverse=True)
-    return conversations
+  def _resolve_index_entries(
+    self, files: Iterable[Tuple[str, str, os.stat_result]]
+  ) -> List[Tuple[str, str, IndexEntry]]:
+    """Pair discovered files with their index entries.
+
+    Index hits are resolved inline. Files that have to be read are handed to a
+    thread pool when there are enough of them for the parallel reads to pay off.
+    """
+    resolved = []
+    misses = []
+    for file_path, project_dir_name, stat_result in files:
+      entry = self._index.lookup(
+        file_path, stat_result.st_mtime_ns, stat_result.st_size
+      )
+      if entry is None:
+        misses.append((file_path, project_dir_name, stat_result))
+      else:
+        resolved.append((file_path, project_dir_name, entry))
+
+    # Every file in a project directory shares its project path, so resolve it
+    # once per directory instead of scanning the head of each new file.
+    dir_project_paths = {
+      project_dir_name: self._get_project_path_for_dir(project_dir_name)
+      for project_dir_name in {item[1] for item in misses}
+    }
+
+    def read_entry(item):
+      file_path, project_dir_name, stat_result = item
+      entry = IndexEntry(
+        mtime_ns=stat_result.st_mtime_ns,
+        size=stat_result.st_size,
+        parent_uuid=self._get_parent_uuid(Path(file_path)),
+        project_path=dir_project_paths[project_dir_name],
+      )
+      self._index.store(file_path, entry)
+      return file_path, project_dir_name, entry
+
+    if len(misses) > _PARALLEL_READ_THRESHOLD:
+      from concurrent.futures import ThreadPoolExecutor
+
+      max_workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+      with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = list(executor.map(read_entry, misses))
+    else:
+      loaded = [read_entry(item) for item in misses]
+
+    resolved.extend(loaded)
+    return resolved
+
+  def _get_project_path_for_dir(self, project_dir_name: str) -> Optional[str]:
+    """Return the metadata project path for a project directory, cached."""
+    cached_path = self._project_dir_cache.get(project_dir_name)
+    if cached_path:
+      return cached_path
+    project_path = self._get_project_path_from_dir(
+      self.claude_projects_dir / project_dir_name
+    )
+    if project_path:
+      self._project_dir_cache[project_dir_name] = project_path
+    return project_path
+
+  def _load_conversation(
+    self, file_path: Path, project_dir_name: str, *, entry: Optional[IndexEntry] = None
+  ) -> ConversationFile:
+    """Build a ConversationFile from a JSONL file on disk.
+
+    ``entry`` may be passed when the caller has already looked up the file.
+    """
+    uuid = file_path.stem
+
+    if entry is None:
+      entry = self._index_entry(file_path)
+
+    # Prefer the project path from JSONL metadata
+    if entry.project_path:
+      project_path = entry.project_path
+    else:
+      # Fallback to reconstructing from directory name (may be incorrect for paths with hyphens)
+      project_path = str(self._project_dir_to_path(project_dir_name))
+
+    try:
+      last_modified = datetime.fromtimestamp(entry.mtime_ns / 1_000_000_000)
+    except (OSError, OverflowError, ValueError):
+      # Fallback to current time if the timestamp is unusable
+      last_modified = datetime.now()
+
+    return ConversationFile(
+      path=file_path,
+      uuid=uuid,
+      project_dir=project_dir_name,
+      project_path=project_path,
+      last_modified=last_modified,
+      parent_uuid=entry.parent_uuid,
+      mtime_ns=entry.mtime_ns,
+      size=entry.size,
+    )
+
+  def _index_entry(
+    self, file_path: Path, stat_result: Optional[os.stat_result] = None
+  ) -> IndexEntry:
+    """Return parentUuid/project path for a file, reading it only if changed.
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    if stat_result is None:
+      stat_result = file_path.stat()
+    key = str(file_path)
+    entry = self._index.lookup(key, stat_result.st_mtime_ns, stat_result.st_size)
+    if entry is None:
+      parent_uuid, project_path = self._read_head_metadata(file_path)
+      entry = IndexEntry(
+        mtime_ns=stat_result.st_mtime_ns,
+        size=stat_result.st_size,
+        parent_uuid=parent_uuid,
+        project_path=project_path,
+      )
+      self._index.store(key, entry)
+    return entry
 
   def find_conversation(self, session_id: str) -> ConversationFile:
     """Find a specific conversation by full or partial session ID.
@@ -353,21 +721,20 @@ class ClaudeConversationManager:
         InvalidUUIDError: If the session_id format is invalid
     """
     # Validate UUID format (allow partial UUIDs)
-    if not re.match(r'^[0-9a-f-]+$', session_id.lower()):
+    if not _SESSION_ID_PATTERN.fullmatch(session_id.lower()):
       raise InvalidUUIDError(session_id)
 
-    # Get all conversations
-    all_conversations = self.find_all_conversations(all_projects=True)
+    # A full UUID names exactly one file per project, so probe for it directly
+    # instead of listing every conversation.
+    if _FULL_UUID_PATTERN.fullmatch(session_id):
+      matches = self._find_conversation_files(session_id)
+      if not matches:
+        raise ConversationNotFoundError(session_id)
+      return max(matches, key=lambda c: c.last_modified)
 
-    # First try exact match
-    exact_matches = [conv for conv in all_conversations if conv.uuid == session_id]
-    if exact_matches:
-      return exact_matches[0]
-
-    # Then try partial match from beginning
-    partial_matches = [
-      conv for conv in all_conversations if conv.uuid.startswith(session_id)
-    ]
+    # A partial ID can only match files whose names start with it, so the
+    # directory listing is filtered before any file is opened.
+    partial_matches = self._find_conversations_by_prefix(session_id)
 
     if not partial_matches:
       raise ConversationNotFoundError(session_id)
@@ -376,6 +743,42 @@ class ClaudeConversationManager:
     else:
       raise AmbiguousSessionIDError(session_id, partial_matches)
 
+  def _find_conversations_by_prefix(self, prefix: str) -> List[ConversationFile]:
+    """Return conversations whose UUID starts with ``prefix``, newest first."""
+    target_project_dirs = self._resolve_target_project_dirs(None, False, True)
+
+    matches = []
+    for file_path, project_dir_name, entry in self._resolve_index_entries(
+      self._iter_conversation_files(target_project_dirs, name_prefix=prefix)
+    ):
+      try:
+        matches.append(
+          self._load_conversation(Path(file_path), project_dir_name, entry=entry)
+        )
+      except (OSError, PermissionError):
+        continue
+    self._index.save()
+
+    matches.sort(key=attrgetter('mtime_ns'), reverse=True)
+    return matches
+
+  def _find_conversation_files(self, session_uuid: str) -> List[ConversationFile]:
+    """Return every project's conversation stored as ``<session_uuid>.jsonl``."""
+    file_name = f'{session_uuid}.jsonl'
+    matches = []
+    for project_dir_name in self._resolve_target_project_dirs(None, False, True):
+      file_path = self.claude_projects_dir / project_dir_name / file_name
+      try:
+        stat_result = os.stat(file_path)
+        entry = self._index_entry(file_path, stat_result)
+        matches.append(
+          self._load_conversation(file_path, project_dir_name, entry=entry)
+        )
+      except (OSError, PermissionError):
+        continue
+    self._index.save()
+    return matches
+
   def branch_conversation(
     self, session_id: str, target_project_path: Optional[Path] = None
   ) -> ConversationFile:
@@ -441,28 +844,50 @@ class ClaudeConversationManager:
     target_project_dir = self._path_to_project_dir(target_project_path)
     target_dir_path = self.claude_projects_dir / target_project_dir
 
-    target_dir_path.mkdir(parents=True, exist_ok=True)
+    if target_project_dir not in self._known_project_dirs:
+      target_dir_path.mkdir(parents=True, exist_ok=True)
+      self._known_project_dirs.add(target_project_dir)
 
     new_uuid = str(uuid_module.uuid4())
     target_file_path = target_dir_path / f'{new_uuid}.jsonl'
 
-    shutil.copy2(source_conversation.path, target_file_path)
+    # The copy is written straight from the source with its new first line and
+    # metadata, so the source is read once and the copy written once.
+    first_line = self._reparented_first_line(source_conversation.path, parent_uuid)
+    git_branch = self._detect_git_branch(target_project_path)
 
-    if parent_uuid:
-      self._set_parent_uuid_in_jsonl(target_file_path, parent_uuid)
-    else:
-      self._clear_parent_uuid_in_jsonl(target_file_path)
+    def write_copy() -> None:
+      # A copy within its own project keeps its paths; only a known git branch
+      # could still need recording, so skip the metadata pass otherwise.
+      if git_branch or target_project_dir != source_conversation.project_dir:
+        self._rewrite_project_metadata(
+          target_file_path,
+          Path(source_conversation.project_path),
+          target_project_path,
+          source_conversation.project_dir,
+          target_project_dir,
+          git_branch,
+          first_line=first_line,
+          source_file=source_conversation.path,
+        )
+      else:
+        _copy_file(source_conversation.path, target_file_path, first_line)
 
-    source_project_path = Path(source_conversation.project_path)
-    git_branch = self._detect_git_branch(target_project_path)
-    self._rewrite_project_metadata(
-      target_file_path,
-      source_project_path,
-      target_project_path,
-      source_conversation.project_dir,
-      target_project_dir,
-      git_branch,
-    )
+    try:
+      write_copy()
+    except FileNotFoundError:
+      # The directory may have been removed since this manager created it.
+      if target_dir_path.is_dir():
+        raise
+      target_dir_path.mkdir(parents=True, exist_ok=True)
+      write_copy()
+
+    # Write the new file through to the index so the next scan skips it.
+    try:
+      self._index_entry(target_file_path)
+      self._index.save()
+    except OSError:
+      pass
 
     return ConversationFile(
       path=target_file_path,
@@ -474,8 +899,23 @@ class ClaudeConversationManager:
     )
 
   def _detect_git_branch(self, project_path: Path) -> Optional[str]:
-    git_dir = project_path / '.git'
-    head_file = git_dir / 'HEAD'
+    head_file = project_path / '.git' / 'HEAD'
+    try:
+      mtime_ns = os.stat(head_file).st_mtime_ns
+    except OSError:
+      return None
+
+    key = str(project_path)
+    cached = self._git_branch_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+      return cached[1]
+
+    branch = self._read_git_branch(head_file)
+    self._git_branch_cache[key] = (mtime_ns, branch)
+    return branch
+
+  @staticmethod
+  def _read_git_branch(head_file: Path) -> Optional[str]:
     try:
       head_content = head_file.read_text(encoding='utf-8').strip()
     except OSError:
@@ -500,61 +940,122 @@ class ClaudeConversationManager:
     source_project_dir: str,
     target_project_dir: str,
     git_branch: Optional[str],
+    *,
+    first_line: Optional[str] = None,
+    source_file: Optional[Path] = None,
   ) -> None:
-    try:
-      with conversation_file.open('r', encoding='utf-8') as handle:
-        lines = handle.readlines()
-    except OSError:
-      return
+    """Point project metadata in ``conversation_file`` at the target project.
 
-    parsed_records: List[Tuple[str, Optional[Any]]] = []
-    for raw_line in lines:
-      stripped = raw_line.rstrip('\n')
-      record: Optional[Any]
-      if not stripped.strip():
-        record = None
-      else:
-        try:
-          record = json.loads(stripped)
-        except json.JSONDecodeError:
-          record = None
-      parsed_records.append((stripped, record))
+    With ``source_file``, records are read from that file and the result is
+    written to ``conversation_file``, so a branch needs no separate copy.
+    ``first_line``, when given, replaces the first line in the same pass.
+    Fixing metadata in place is best effort, but writing a new file or a new
+    first line is not: those failures are raised.
+    """
+    read_path = source_file or conversation_file
+    required = source_file is not None or first_line is not None
 
     source_path_candidates = {str(source_project_path)}
     source_dir_candidates = {source_project_dir}
 
-    for _, data in parsed_records:
-      if data is not None:
-        self._collect_metadata_candidates(
-          data, source_path_candidates, source_dir_candidates
-        )
+    # Candidates only come from project path/dir keys, so they are read off
+    # each line without decoding the records around them.
+    try:
+      with read_path.open('r', encoding='utf-8') as handle:
+        for raw_line in handle:
+          self._collect_line_candidates(
+            raw_line, source_path_candidates, source_dir_candidates
+          )
+    except OSError:
+      if required:
+        raise
+      return
 
-    updated_lines: List[str] = []
-    for stripped, data in parsed_records:
-      if data is None:
-        updated_lines.append(stripped)
-        continue
+    # Branching within the same project maps every candidate onto itself, so
+    # only the first line and, when one is known, the git branch can change.
+    same_paths = source_path_candidates == {str(target_project_path)}
+    paths_unchanged = same_paths and source_dir_candidates == {target_project_dir}
+    if paths_unchanged and not git_branch:
+      if source_file is not None:
+        _copy_file(source_file, conversation_file, first_line)
+      elif first_line is not None:
+        self._write_first_line(conversation_file, first_line)
+      return
 
-      mutated = self._rewrite_metadata_node(
-        data,
-        source_project_path,
-        target_project_path,
-        source_project_dir,
-        target_project_dir,
-        git_branch,
-        source_path_candidates,
-        source_dir_candidates,
-      )
-      updated_lines.append(json.dumps(mutated))
+    # A line can only change if it contains a candidate value that maps
+    # elsewhere or, when a new branch is known, a gitBranch key. Everything
+    # else is copied verbatim.
+    change_pattern = self._metadata_change_pattern(
+      () if paths_unchanged else source_path_candidates | source_dir_candidates,
+      git_branch,
+    )
 
+    # Stream the rewrite into a sibling temporary file so only one record is
+    # held in memory at a time. It is moved into place when a line changed or
+    # when it is a new copy.
     try:
-      with conversation_file.open('w', encoding='utf-8') as handle:
-        for line in updated_lines:
-          handle.write(f'{line}\n')
+      fd, tmp_name = tempfile.mkstemp(
+        dir=conversation_file.parent,
+        prefix=f'.{conversation_file.name}.',
+        suffix='.tmp',
+      )
     except OSError:
-      # Ignore write errors; the copy already exists even if metadata isn't ideal.
+      if required:
+        raise
       return
 
+    replacement = first_line
+    changed = False
+    replaced = False
+    try:
+      with (
+        read_path.open('r', encoding='utf-8') as source,
+        os.fdopen(fd, 'w', encoding='utf-8') as target,
+      ):
+        for raw_line in source:
+          stripped = raw_line.rstrip('\n')
+          if replacement is not None:
+            stripped, replacement = replacement, None
+            changed = True
+          line = stripped
+          if stripped.strip() and (
+            change_pattern is None or change_pattern.search(stripped)
+          ):
+            try:
+              data = load_json(stripped)
+            except ValueError:
+              pass
+            else:
+              data, line_changed = self._rewrite_metadata_node(
+                data,
+                source_project_path,
+                target_project_path,
+                source_project_dir,
+                target_project_dir,
+                git_branch,
+                source_path_candidates,
+                source_dir_candidates,
+              )
+              if line_changed:
+                line = dump_json(data)
+                changed = True
+          target.write(f'{line}\n')
+      if changed or source_file is not None:
+        shutil.copymode(read_path, tmp_name)
+        os.replace(tmp_name, conversation_file)
+        replaced = True
+    except OSError:
+      # Otherwise ignore write errors; the file already exists even if its
+      # metadata isn't ideal.
+      if required:
+        raise
+    finally:
+      if not replaced:
+        try:
+          os.unlink(tmp_name)
+        except OSError:
+          pass
+
   _BRANCH_KEYS = {'gitBranch'}
   _PROJECT_DIR_KEYS = {'projectDir', 'projectDirectory'}
   _PROJECT_PATH_KEYS = {
@@ -565,36 +1066,78 @@ class ClaudeConversationManager:
     'cwd',
     'repoPath',
   }
+  # A metadata key followed by either a JSON string value or an opening bracket.
+  _METADATA_VALUE_PATTERN = re.compile(
+    '"('
+    + '|'.join(sorted(_PROJECT_DIR_KEYS | _PROJECT_PATH_KEYS))
+    + r')"\s*:\s*(?:"([^"\\]*(?:\\.[^"\\]*)*)"|\[)'
+  )
 
-  def _collect_metadata_candidates(
-    self,
-    value: Any,
-    path_candidates: set[str],
-    dir_candidates: set[str],
-    *,
-    key: Optional[str] = None,
-  ) -> None:
-    if isinstance(value, dict):
-      for field, field_value in value.items():
-        self._collect_metadata_candidates(
-          field_value, path_candidates, dir_candidates, key=field
-        )
-      return
+  @classmethod
+  def _metadata_change_pattern(
+    cls, candidates: Iterable[str], git_branch: Optional[str]
+  ) -> Optional['re.Pattern[str]']:
+    """Match lines that the metadata rewrite could change.
 
-    if isinstance(value, list):
-      for item in value:
-        self._collect_metadata_candidates(
-          item, path_candidates, dir_candidates, key=key
-        )
-      return
+    Returns ``None`` when every line has to be rewritten, which happens when an
+    empty candidate would match any string value.
+    """
+    tokens = set()
+    for candidate in candidates:
+      if not candidate:
+        return None
+      tokens.add(candidate)
+      # Lines may hold the value raw or JSON-escaped, with non-ASCII characters
+      # either kept as-is (Node, orjson) or written as \uXXXX escapes.
+      tokens.add(json.dumps(candidate)[1:-1])
+      tokens.add(json.dumps(candidate, ensure_ascii=False)[1:-1])
+    if git_branch:
+      tokens.update(f'"{key}"' for key in cls._BRANCH_KEYS)
+    return re.compile('|'.join(re.escape(token) for token in sorted(tokens)))
+
+  def _collect_line_candidates(
+    self, line: str, path_candidates: set[str], dir_candidates: set[str]
+  ) -> None:
+    """Collect candidates from one JSONL line, decoding only their values.
 
-    if not isinstance(value, str):
-      return
+    A key that holds a list falls back to decoding the whole record, since the
+    list's string items count as candidates too.
+    """
+    for match in self._METADATA_VALUE_PATTERN.finditer(line):
+      key, value = match.groups()
+      if value is None:
+        try:
+          data = load_json(line)
+        except ValueError:
+          return
+        self._collect_metadata_candidates(data, path_candidates, dir_candidates)
+        return
+      if '\\' in value:
+        try:
+          value = load_json(f'"{value}"')
+        except ValueError:
+          continue
+      if key in self._PROJECT_PATH_KEYS:
+        path_candidates.add(value)
+      if key in self._PROJECT_DIR_KEYS:
+        dir_candidates.add(value)
 
-    if key in self._PROJECT_PATH_KEYS:
-      path_candidates.add(value)
-    if key in self._PROJECT_DIR_KEYS:
-      dir_candidates.add(value)
+  def _collect_metadata_candidates(
+    self, value: Any, path_candidates: set[str], dir_candidates: set[str]
+  ) -> None:
+    # Walk the record with an explicit stack; list items inherit their key.
+    stack: List[Tuple[Optional[str], Any]] = [(None, value)]
+    while stack:
+      key, node = stack.pop()
+      if isinstance(node, dict):
+        stack.extend(node.items())
+      elif isinstance(node, list):
+        stack.extend((key, item) for item in node)
+      elif isinstance(node, str):
+        if key in self._PROJECT_PATH_KEYS:
+          path_candidates.add(node)
+        if key in self._PROJECT_DIR_KEYS:
+          dir_candidates.add(node)
 
   def _rewrite_metadata_node(
     self,
@@ -606,45 +1149,17 @@ class ClaudeConversationManager:
     git_branch: Optional[str],
     source_path_candidates: set[str],
     source_dir_candidates: set[str],
-    *,
-    key: Optional[str] = None,
-  ) -> Any:
-    if isinstance(value, dict):
-      return {
-        field: self._rewrite_metadata_node(
-          field_value,
-          source_project_path,
-          target_project_path,
-          source_project_dir,
-          target_project_dir,
-          git_branch,
-          source_path_candidates,
-          source_dir_candidates,
-          key=field,
-        )
-        for field, field_value in value.items()
-      }
-
-    if isinstance(value, list):
-      return [
-        self._rewrite_metadata_node(
-          item,
-          source_project_path,
-          target_project_path,
-          source_project_dir,
-          target_project_dir,
-          git_branch,
-          source_path_candidates,
-          source_dir_candidates,
-          key=key,
-        )
-        for item in value
-      ]
+  ) -> Tuple[Any, bool]:
+    """Rewrite metadata strings in a decoded record, mutating it in place.
 
-    if isinstance(value, str):
+    Returns the rewritten value and whether anything changed. Only strings that
+    actually change are replaced; untouched containers are never copied.
+    """
+
+    def rewrite(key: Optional[str], text: str) -> str:
       return self._rewrite_metadata_string(
         key,
-        value,
+        text,
         source_project_path,
         target_project_path,
         source_project_dir,
@@ -654,7 +1169,35 @@ class ClaudeConversationManager:
         source_dir_candidates,
       )
 
-    return value
+    if isinstance(value, str):
+      rewritten = rewrite(None, value)
+      return rewritten, rewritten != value
+
+    changed = False
+    # Each entry is a container plus the key its list items inherit.
+    stack: List[Tuple[Optional[str], Any]] = [(None, value)]
+    while stack:
+      key, node = stack.pop()
+      if isinstance(node, dict):
+        for field, field_value in node.items():
+          if isinstance(field_value, str):
+            rewritten = rewrite(field, field_value)
+            if rewritten != field_value:
+              node[field] = rewritten
+              changed = True
+          elif isinstance(field_value, (dict, list)):
+            stack.append((field, field_value))
+      elif isinstance(node, list):
+        for index, item in enumerate(node):
+          if isinstance(item, str):
+            rewritten = rewrite(key, item)
+            if rewritten != item:
+              node[index] = rewritten
+              changed = True
+          elif isinstance(item, (dict, list)):
+            stack.append((key, item))
+
+    return value, changed
 
   def _rewrite_metadata_string(
     self,
@@ -718,22 +1261,32 @@ class ClaudeConversationManager:
         - root_conversations: Conversations with no parent
         - children_dict: Dict mapping parent UUID to list of child conversations
     """
-    children_dict = defaultdict(list)
+    children_dict: Dict[str, List[ConversationFile]] = {}
     roots = []
 
     for conversation in conversations:
-      if conversation.parent_uuid:
-        children_dict[conversation.parent_uuid].append(conversation)
+      parent_uuid = conversation.parent_uuid
+      if parent_uuid:
+        siblings = children_dict.get(parent_uuid)
+        if siblings is None:
+          children_dict[parent_uuid] = [conversation]
+        else:
+          siblings.append(conversation)
       else:
         roots.append(conversation)
 
     return roots, children_dict
 
-  def get_conversation_ancestry(self, session_id: str) -> List[ConversationFile]:
+  def get_conversation_ancestry(
+    self, session_id: str, conversations: Optional[List[ConversationFile]] = None
+  ) -> List[ConversationFile]:
     """Get the full ancestry chain for a conversation (from root to current).
 
     Args:
         session_id: UUID of the conversation to trace
+        conversations: Already-loaded conversations to resolve parents from.
+            When omitted, all projects are scanned once if the conversation
+            has a parent.
 
     Returns:
         List of ConversationFile objects representing the ancestry chain
@@ -743,6 +1296,16 @@ class ClaudeConversationManager:
     """
     conversation = self.find_conversation(session_id)
     ancestry = [conversation]
+    if not conversation.parent_uuid:
+      return ancestry
+
+    if conversations is None:
+      conversations = self.find_all_conversations(all_projects=True)
+
+    # Keep the first (newest) file per UUID, matching find_conversation.
+    by_uuid: Dict[str, ConversationFile] = {}
+    for candidate in conversations:
+      by_uuid.setdefault(candidate.uuid, candidate)
 
     # Walk up the parent chain
     current = conversation
@@ -750,12 +1313,13 @@ class ClaudeConversationManager:
 
     while current.parent_uuid and current.parent_uuid not in seen_uuids:
       seen_uuids.add(current.parent_uuid)
-      try:
-        parent = self.find_conversation(current.parent_uuid)
-        ancestry.insert(0, parent)  # Add to beginning
-        current = parent
-      except ConversationNotFoundError:
+      parent = by_uuid.get(current.parent_uuid)
+      if parent is None:
         # Parent not found, stop traversing
         break
+      ancestry.append(parent)
+      current = parent
 
+    # The walk collects the chain leaf-first; callers expect it root-first.
+    ancestry.reverse()
     return ancestry
@@ -0,0 +1,36 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional dependency
+  orjson = None
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+  """Decode a JSON document, using orjson when it is installed.
+
+  Both backends raise ``json.JSONDecodeError`` (or another ``ValueError``) on
+  malformed input, and both accept ``bytes`` so JSONL files can be read in
+  binary mode without a separate decode step.
+  """
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def dump_json(value: Any) -> str:
+  """Encode ``value`` as compact JSON, using orjson when it is installed.
+
+  Output is the same with either backend: no whitespace and non-ASCII text left
+  unescaped. Values orjson cannot encode, such as integers wider than 64 bits,
+  go through the standard library instead.
+  """
+  if orjson is not None:
+    try:
+      return orjson.dumps(value).decode('utf-8')
+    except TypeError:
+      pass
+  return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
@@ -1,12 +1,14 @@
 """TUI interface for claude-bushwack using Textual."""
 
+import os
 import shutil
 import textwrap
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, cast
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypeVar, cast
 
 from rich.console import Group
 from rich.panel import Panel
@@ -23,12 +25,17 @@ from textual.screen import ModalScreen
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
 from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import DirectoryTree, Footer, Input, Static, Tree
 from textual.widgets._directory_tree import DirEntry
 from textual.widgets.tree import TreeNode
 from textual.worker import Worker, WorkerState
 
-from .conversation_metadata import ConversationMetadata, extract_conversation_metadata
+from .conversation_metadata import (
+  ConversationMetadata,
+  MetadataCache,
+  extract_conversation_metadata,
+)
 from .core import ClaudeConversationManager, ConversationFile
 from .exceptions import (
   AmbiguousSessionIDError,
@@ -39,6 +46,14 @@ from .exceptions import (
 
 _PREVIEW_LIMIT = 30
 _PREVIEW_PANE_LIMIT = 600
+# Below this many conversations a thread pool costs more than it saves.
+_PARALLEL_DISPLAY_THRESHOLD = 8
+# Distinct formatted metadata rows kept between repaints.
+_COLUMN_CACHE_SIZE = 4096
+# Row timestamps repeat across reloads, so their formatted forms are kept.
+_TIMESTAMP_CACHE_SIZE = 8192
+
+_WidgetT = TypeVar('_WidgetT', bound=Widget)
 
 _BASE_COLUMN_LAYOUT = [
   ('modified', 12, 'Modified'),
@@ -539,6 +554,15 @@ class BushwackApp(App):
   def __init__(self) -> None:
     super().__init__()
     self.conversation_manager = ClaudeConversationManager()
+    # Parsed metadata is saved next to the conversation index so a restart only
+    # re-reads transcripts that changed. Managers without a saved index (tests,
+    # custom roots) skip it.
+    index_path = self.conversation_manager.index_path
+    self._metadata_cache: Optional[MetadataCache] = (
+      MetadataCache(index_path.with_name('metadata.json'))
+      if index_path is not None
+      else None
+    )
     self.show_all_projects = False
     self._status_timer: Optional[Timer] = None
     self._selected_uuid: Optional[str] = None
@@ -547,6 +571,21 @@ class BushwackApp(App):
     self.preview_visible = False
     self._all_projects_cache: Optional[AllProjectsCache] = None
     self._all_projects_worker: Optional[Worker[AllProjectsCache]] = None
+    self._widget_cache: Dict[str, Widget] = {}
+    # Signature of the listing the tree currently shows; see _listing_signature.
+    self._shown_listing: Optional[Tuple] = None
+
+  def _query_widget(self, selector: str, expect_type: Type[_WidgetT]) -> _WidgetT:
+    """``query_one`` for the app's fixed widgets, remembered after first use.
+
+    Action handlers look up the same few widgets on every keypress; a CSS
+    query walks the DOM each time while the widgets never change.
+    """
+    widget = self._widget_cache.get(selector)
+    if widget is None or not widget.is_attached:
+      widget = self.query_one(selector, expect_type)
+      self._widget_cache[selector] = widget
+    return cast(_WidgetT, widget)
 
   def compose(self) -> ComposeResult:
     """Create child widgets for the app."""
@@ -604,10 +643,10 @@ class BushwackApp(App):
 
   def on_mount(self) -> None:
     """Called when the app starts."""
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     tree.vertical_scrollbar.display = False
     tree.horizontal_scrollbar.display = False
-    metadata_lines = self.query_one('#metadata_lines', MetadataLines)
+    metadata_lines = self._query_widget('#metadata_lines', MetadataLines)
     metadata_lines.vertical_scrollbar.display = False
     metadata_lines.horizontal_scrollbar.display = False
     metadata_lines.attach_tree(tree)
@@ -628,15 +667,10 @@ class BushwackApp(App):
   ) -> None:
     """Load conversations and populate the tree."""
     self._update_column_headers()
-    tree = self.query_one('#conversation_tree', Tree)
-    self._collapse_expanded_row()
-    tree.clear()
-    tree.root.label = 'Conversations'
-    tree.root.expand()
-    self._node_lookup = {}
-    self._clear_preview()
+    tree = self._query_widget('#conversation_tree', Tree)
 
     try:
+      display_data: Optional[Dict[str, ConversationDisplayData]] = None
       if self.show_all_projects:
         cache = None if force_cache_bypass else self._all_projects_cache
         if cache and not cache.is_empty():
@@ -646,19 +680,34 @@ class BushwackApp(App):
           conversations = self.conversation_manager.find_all_conversations(
             all_projects=True
           )
-          display_data = self._build_display_data(conversations)
-          self._all_projects_cache = AllProjectsCache(
-            conversations=conversations, display_data=display_data
-          )
         scope = 'all projects'
       else:
         conversations = self.conversation_manager.find_all_conversations(
           current_project_only=True
         )
-        display_data = self._build_display_data(conversations)
         scope = 'current project'
 
+      listing = self._listing_signature(conversations)
+      if listing is not None and listing == self._shown_listing:
+        # Same files at the same versions as the tree already shows: keep the
+        # existing nodes, with their expansion and cursor state.
+        if focus_uuid and focus_uuid != self._selected_uuid:
+          self._focus_on_uuid(tree, focus_uuid)
+        if announce_scope:
+          self.show_status(f'Scope: {scope}')
+        return
+
+      if display_data is None:
+        display_data = self._build_display_data(conversations)
+        if self.show_all_projects:
+          self._all_projects_cache = AllProjectsCache(
+            conversations=conversations, display_data=display_data
+          )
+
+      self._reset_tree(tree)
+      self._shown_listing = None
       self.populate_tree(tree, conversations, display_data)
+      self._shown_listing = listing
 
       target_uuid = focus_uuid or self._selected_uuid
       if target_uuid:
@@ -671,9 +720,35 @@ class BushwackApp(App):
       self._refresh_metadata_lines()
       self._sync_metadata_scroll()
     except Exception as exc:  # pragma: no cover - defensive logging
+      self._reset_tree(tree)
+      self._shown_listing = None
       tree.root.add_leaf(f'Error loading conversations: {exc}')
       self.show_status('Unable to load conversations')
 
+  def _reset_tree(self, tree: Tree) -> None:
+    self._collapse_expanded_row()
+    tree.clear()
+    tree.root.label = 'Conversations'
+    tree.root.expand()
+    self._node_lookup = {}
+    self._clear_preview()
+
+  def _listing_signature(
+    self, conversations: List[ConversationFile]
+  ) -> Optional[Tuple]:
+    """Identify a listing by scope and each file's path, mtime, and size.
+
+    Any append, branch, copy, or deletion changes at least one of these, so an
+    equal signature means the tree on screen is still accurate. Returns
+    ``None`` when a file's stat values are unknown.
+    """
+    files = []
+    for conversation in conversations:
+      if conversation.mtime_ns is None:
+        return None
+      files.append((str(conversation.path), conversation.mtime_ns, conversation.size))
+    return (self.show_all_projects, tuple(files))
+
   def populate_tree(
     self,
     tree: Tree,
@@ -690,20 +765,25 @@ class BushwackApp(App):
       conversations
     )
 
+    known_uuids = {conv.uuid for conv in conversations}
     orphaned = [
       conv
       for conv in conversations
-      if conv.parent_uuid and conv.parent_uuid not in {c.uuid for c in conversations}
+      if conv.parent_uuid and conv.parent_uuid not in known_uuids
     ]
 
-    if self.show_all_projects:
-      self._populate_all_projects_tree(tree, roots, children_dict, display_data)
-    else:
-      self._populate_current_project_tree(tree.root, roots, children_dict, display_data)
+    # Every node added invalidates the tree; hold repaints until it is built.
+    with self.batch_update():
+      if self.show_all_projects:
+        self._populate_all_projects_tree(tree, roots, children_dict, display_data)
+      else:
+        self._populate_current_project_tree(
+          tree.root, roots, children_dict, display_data
+        )
 
-    self._add_orphaned_conversations(tree.root, orphaned, children_dict, display_data)
+      self._add_orphaned_conversations(tree.root, orphaned, children_dict, display_data)
 
-    tree.root.expand()
+      tree.root.expand()
 
   def _populate_current_project_tree(
     self,
@@ -782,7 +862,40 @@ class BushwackApp(App):
     is_root: bool = False,
     is_orphaned: bool = False,
   ) -> TreeNode:
-    """Add a conversation node to the tree."""
+    """Add a conversation and all of its descendants to the tree."""
+    node = self._add_conversation_node(
+      parent_node,
+      conversation,
+      children_dict,
+      display_data,
+      is_root=is_root,
+      is_orphaned=is_orphaned,
+    )
+    # Walk descendants with an explicit stack so deep branch chains do not
+    # grow the Python call stack.
+    stack: List[Tuple[TreeNode, ConversationFile]] = [(node, conversation)]
+    while stack:
+      current_node, current = stack.pop()
+      children = children_dict.get(current.uuid)
+      if not children:
+        continue
+      for child in sorted(children, key=lambda item: item.last_modified):
+        child_node = self._add_conversation_node(
+          current_node, child, children_dict, display_data
+        )
+        stack.append((child_node, child))
+    return node
+
+  def _add_conversation_node(
+    self,
+    parent_node: TreeNode,
+    conversation: ConversationFile,
+    children_dict: Dict[str, List[ConversationFile]],
+    display_data: Dict[str, ConversationDisplayData],
+    *,
+    is_root: bool = False,
+    is_orphaned: bool = False,
+  ) -> TreeNode:
     uuid_display = f'{conversation.uuid[:8]}...'
     modified_display = self._format_timestamp(conversation.last_modified)
     display_info = display_data.get(conversation.uuid, ConversationDisplayData())
@@ -828,27 +941,20 @@ class BushwackApp(App):
 
     node = parent_node.add(label_text, data=node_data)
     self._node_lookup[conversation.uuid] = node
-
-    if conversation.uuid in children_dict:
-      for child in sorted(
-        children_dict[conversation.uuid], key=lambda item: item.last_modified
-      ):
-        self._add_conversation_to_tree(node, child, children_dict, display_data)
-
     return node
 
   def action_cursor_down(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     tree.action_cursor_down()
     self._set_selected_from_node(tree.cursor_node)
 
   def action_cursor_up(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     tree.action_cursor_up()
     self._set_selected_from_node(tree.cursor_node)
 
   def action_collapse_node(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if node and node.is_expanded:
       node.collapse()
@@ -857,7 +963,7 @@ class BushwackApp(App):
     self._set_selected_from_node(tree.cursor_node)
 
   def action_expand_node(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if node and node.children and not node.is_expanded:
       node.expand()
@@ -866,7 +972,7 @@ class BushwackApp(App):
     self._set_selected_from_node(tree.cursor_node)
 
   def action_toggle_branch(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if node and node.children:
       if self._branch_is_expanded(node):
@@ -877,25 +983,24 @@ class BushwackApp(App):
       self._set_selected_from_node(node)
 
   def action_cursor_top(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     if tree.root.children:
       tree.select_node(tree.root.children[0])
       self._set_selected_from_node(tree.cursor_node)
 
   def action_cursor_bottom(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
-
-    def find_last(target: TreeNode) -> TreeNode:
-      if not target.children or not target.is_expanded:
-        return target
-      return find_last(target.children[-1])
+    tree = self._query_widget('#conversation_tree', Tree)
+    if not tree.root.children:
+      return
 
-    if tree.root.children:
-      tree.select_node(find_last(tree.root.children[-1]))
-      self._set_selected_from_node(tree.cursor_node)
+    last = tree.root.children[-1]
+    while last.children and last.is_expanded:
+      last = last.children[-1]
+    tree.select_node(last)
+    self._set_selected_from_node(tree.cursor_node)
 
   def action_branch_conversation(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if not node or not isinstance(node.data, ConversationNodeData):
       self.show_status('Select a conversation to branch')
@@ -931,14 +1036,46 @@ class BushwackApp(App):
     )
     self._selected_uuid = new_conversation.uuid
     self._prime_all_projects_cache(force=True)
+    if self._append_branched_conversation(new_conversation):
+      return
     self.load_conversations(
       focus_uuid=new_conversation.uuid,
       announce_scope=False,
       force_cache_bypass=self.show_all_projects,
     )
 
+  def _append_branched_conversation(self, conversation: ConversationFile) -> bool:
+    """Add a new branch under its parent's node instead of reloading the tree.
+
+    Only the new transcript is read. Returns ``False`` when the parent is not
+    on screen or sits in another project, or in the all-projects scope whose
+    background reload rebuilds the tree anyway; the caller then reloads.
+    """
+    if self.show_all_projects or not conversation.parent_uuid:
+      return False
+    parent_node = self._node_lookup.get(conversation.parent_uuid)
+    if parent_node is None or not isinstance(parent_node.data, ConversationNodeData):
+      return False
+    parent_data = parent_node.data
+    if parent_data.conversation.project_dir != conversation.project_dir:
+      return False
+
+    tree = self._query_widget('#conversation_tree', Tree)
+    display_data = {conversation.uuid: self._extract_display_data(conversation)}
+    with self.batch_update():
+      self._add_conversation_to_tree(parent_node, conversation, {}, display_data)
+      parent_data.child_count += 1
+      parent_data.column_values['children'] = str(parent_data.child_count)
+    # The listing on disk changed; let the next reload rebuild the tree.
+    self._shown_listing = None
+
+    self._focus_on_uuid(tree, conversation.uuid)
+    self._refresh_metadata_lines()
+    self._sync_metadata_scroll()
+    return True
+
   def action_copy_move_conversation(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if not node or not isinstance(node.data, ConversationNodeData):
       self.show_status('Select a conversation to copy')
@@ -1007,7 +1144,7 @@ class BushwackApp(App):
     return True
 
   def action_yank_conversation(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if not node or not isinstance(node.data, ConversationNodeData):
       self.show_status('Select a conversation to yank')
@@ -1023,7 +1160,7 @@ class BushwackApp(App):
     self.show_status(f'Copied conversation path to clipboard: {resolved_path}')
 
   def action_open_conversation(self) -> None:
-    tree = self.query_one('#conversation_tree', Tree)
+    tree = self._query_widget('#conversation_tree', Tree)
     node = tree.cursor_node
     if not node or not isinstance(node.data, ConversationNodeData):
       self.show_status('Select a conversation to open')
@@ -1057,7 +1194,7 @@ class BushwackApp(App):
     self.preview_visible = not self.preview_visible
     self._apply_preview_visibility()
     if self.preview_visible:
-      tree = self.query_one('#conversation_tree', Tree)
+      tree = self._query_widget('#conversation_tree', Tree)
       self._set_selected_from_node(tree.cursor_node)
     state = 'shown' if self.preview_visible else 'hidden'
     self.show_status(f'Preview {state}')
@@ -1099,7 +1236,7 @@ class BushwackApp(App):
     self._sync_metadata_scroll()
 
   def show_status(self, message: str, duration: float = 3.0) -> None:
-    status_line = self.query_one('#status_line', Static)
+    status_line = self._query_widget('#status_line', Static)
     status_line.update(message)
     if self._status_timer:
       self._status_timer.stop()
@@ -1107,7 +1244,7 @@ class BushwackApp(App):
 
   def _clear_status(self) -> None:
     try:
-      status_line = self.query_one('#status_line', Static)
+      status_line = self._query_widget('#status_line', Static)
     except NoMatches:
       return
     status_line.update('')
@@ -1117,14 +1254,14 @@ class BushwackApp(App):
 
   def _apply_preview_visibility(self) -> None:
     try:
-      preview = self.query_one('#preview_pane', Static)
+      preview = self._query_widget('#preview_pane', Static)
     except NoMatches:
       return
     preview.display = self.preview_visible
 
   def _clear_preview(self) -> None:
     try:
-      preview = self.query_one('#preview_pane', Static)
+      preview = self._query_widget('#preview_pane', Static)
     except NoMatches:
       return
     placeholder = Panel(
@@ -1136,7 +1273,7 @@ class BushwackApp(App):
 
   def _update_preview_content(self, data: ConversationNodeData) -> None:
     try:
-      preview = self.query_one('#preview_pane', Static)
+      preview = self._query_widget('#preview_pane', Static)
     except NoMatches:
       return
     preview.update(self._build_preview_renderable(data))
@@ -1228,12 +1365,22 @@ class BushwackApp(App):
     node = self._node_lookup.get(uuid)
     if node:
       self._expand_node_path(node)
+      self._rebuild_tree_lines(tree)
       tree.select_node(node)
       self._set_selected_from_node(node)
       tree.scroll_to_node(node, animate=False)
     else:
       self._focus_first_child(tree)
 
+  @staticmethod
+  def _rebuild_tree_lines(tree: Tree) -> None:
+    """Force Textual to rebuild the tree's line cache.
+
+    Nodes added or expanded since the last repaint still report line -1, so
+    ``select_node`` would miss them until the cache is rebuilt.
+    """
+    _ = tree._tree_lines  # Textual internal cache; see MetadataLines docstring.
+
   def _focus_first_child(self, tree: Tree) -> None:
     if tree.root.children:
       first_child = tree.root.children[0]
@@ -1287,16 +1434,66 @@ class BushwackApp(App):
   def _build_display_data(
     self, conversations: List[ConversationFile]
   ) -> Dict[str, ConversationDisplayData]:
-    display_data: Dict[str, ConversationDisplayData] = {}
+    cache = self._metadata_cache
+    metadata_by_uuid: Dict[str, ConversationMetadata] = {}
+    missing: List[ConversationFile] = []
     for conversation in conversations:
-      display_data[conversation.uuid] = self._extract_display_data(conversation)
-    return display_data
+      metadata = None
+      if cache is not None and conversation.mtime_ns is not None:
+        metadata = cache.lookup(
+          str(conversation.path), conversation.mtime_ns, conversation.size
+        )
+      if metadata is None:
+        missing.append(conversation)
+      else:
+        metadata_by_uuid[conversation.uuid] = metadata
+
+    for conversation, metadata in zip(missing, self._extract_metadata(missing)):
+      metadata_by_uuid[conversation.uuid] = metadata
+      if cache is not None and conversation.mtime_ns is not None:
+        cache.store(
+          str(conversation.path), conversation.mtime_ns, conversation.size, metadata
+        )
+
+    if cache is not None:
+      file_paths = [str(conversation.path) for conversation in conversations]
+      cache.prune({os.path.dirname(path) for path in file_paths}, file_paths)
+      cache.save()
+
+    return {
+      conversation.uuid: self._display_data_from(metadata_by_uuid[conversation.uuid])
+      for conversation in conversations
+    }
+
+  @classmethod
+  def _extract_metadata(
+    cls, conversations: List[ConversationFile]
+  ) -> List[ConversationMetadata]:
+    if len(conversations) < _PARALLEL_DISPLAY_THRESHOLD:
+      return [cls._read_metadata(conversation) for conversation in conversations]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Each file is read and parsed independently, so the reads can overlap.
+    workers = min(32, (os.cpu_count() or 1) * 4, len(conversations))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      return list(executor.map(cls._read_metadata, conversations))
+
+  @staticmethod
+  def _read_metadata(conversation: ConversationFile) -> ConversationMetadata:
+    # Previews are never shown past the preview pane's limit; one extra
+    # character still tells the pane that the text was cut off.
+    return extract_conversation_metadata(
+      conversation, preview_chars=_PREVIEW_PANE_LIMIT + 1
+    )
 
   def _extract_display_data(
     self, conversation: ConversationFile
   ) -> ConversationDisplayData:
-    metadata: ConversationMetadata = extract_conversation_metadata(conversation)
+    return self._display_data_from(self._read_metadata(conversation))
 
+  @staticmethod
+  def _display_data_from(metadata: ConversationMetadata) -> ConversationDisplayData:
     return ConversationDisplayData(
       preview=metadata.preview,
       summary=metadata.summary,
@@ -1306,6 +1503,7 @@ class BushwackApp(App):
     )
 
   @staticmethod
+  @lru_cache(maxsize=_TIMESTAMP_CACHE_SIZE)
   def _format_timestamp(value: datetime) -> str:
     if value.tzinfo is not None:
       try:
@@ -1367,7 +1565,13 @@ class BushwackApp(App):
     if not value:
       return placeholder
 
-    compressed = ' '.join(value.split())
+    # Only the first _PREVIEW_LIMIT words can reach the cut-off, so long
+    # previews are not split and rejoined in full. Any words beyond those make
+    # the text longer than the limit anyway.
+    words = value.split(None, _PREVIEW_LIMIT)
+    if len(words) > _PREVIEW_LIMIT:
+      words.pop()
+    compressed = ' '.join(words)
     if len(compressed) <= _PREVIEW_LIMIT:
       return compressed
     return f'{compressed[: _PREVIEW_LIMIT - 3]}...'
@@ -1428,19 +1632,28 @@ class BushwackApp(App):
     layout: Optional[List[tuple[str, int, str]]] = None,
     align: str = 'left',
   ) -> Text:
-    segments = []
     column_layout = layout or self._column_layout()
-    for key, width, _ in column_layout:
-      value = column_values.get(key, '')
-      segments.append(self._pad_column(value, width, align=align))
+    cells = tuple(
+      (column_values.get(key, ''), width) for key, width, _ in column_layout
+    )
+    text = Text(self._join_columns(cells, trailing, prefix, align))
+    text.no_wrap = not wrap
+    return text
 
+  @staticmethod
+  @lru_cache(maxsize=_COLUMN_CACHE_SIZE)
+  def _join_columns(
+    cells: Tuple[Tuple[str, int], ...], trailing: str, prefix: str, align: str
+  ) -> str:
+    # Rows are rebuilt on every repaint after the tree changes, but their
+    # values only change with the conversation, so padded lines are memoized.
+    segments = [
+      BushwackApp._pad_column(value, width, align=align) for value, width in cells
+    ]
     line = f'{prefix}{"  ".join(segments)}'
     if trailing:
       line = f'{line}  {trailing}' if line else trailing
-
-    text = Text(line)
-    text.no_wrap = not wrap
-    return text
+    return line
 
   def _update_node_label(self, node: TreeNode, *, expanded: bool) -> None:
     if not isinstance(node.data, ConversationNodeData):
@@ -1492,13 +1705,13 @@ class BushwackApp(App):
 
   def _update_column_headers(self) -> None:
     try:
-      tree_header = self.query_one('#tree_header', Static)
+      tree_header = self._query_widget('#tree_header', Static)
       tree_header.update(self._render_tree_header())
     except NoMatches:
       pass
 
     try:
-      metadata_header = self.query_one('#metadata_header', Static)
+      metadata_header = self._query_widget('#metadata_header', Static)
       metadata_header.update(self._render_metadata_header())
     except NoMatches:
       pass
@@ -1519,8 +1732,8 @@ class BushwackApp(App):
 
   def _metadata_components(self) -> Optional[Tuple[MetadataLines, Tree]]:
     try:
-      metadata = self.query_one('#metadata_lines', MetadataLines)
-      tree = self.query_one('#conversation_tree', Tree)
+      metadata = self._query_widget('#metadata_lines', MetadataLines)
+      tree = self._query_widget('#conversation_tree', Tree)
     except NoMatches:
       return None
     return metadata, tree
@@ -0,0 +1,117 @@
+"""Tests for the persistent conversation index."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from claude_bushwack.conversation_index import ConversationIndex, IndexEntry
+from claude_bushwack.core import ClaudeConversationManager
+
+
+def test_index_round_trips_through_disk(tmp_path: Path) -> None:
+  index_path = tmp_path / 'cache' / 'index.json'
+  index = ConversationIndex(index_path)
+  entry = IndexEntry(mtime_ns=10, size=20, parent_uuid='abc', project_path='/p')
+  index.store('/projects/a/1.jsonl', entry)
+  index.save()
+
+  reloaded = ConversationIndex(index_path)
+  assert reloaded.lookup('/projects/a/1.jsonl', 10, 20) == entry
+  assert reloaded.lookup('/projects/a/1.jsonl', 11, 20) is None
+  assert reloaded.lookup('/projects/a/1.jsonl', 10, 21) is None
+
+
+def test_index_keeps_untouched_entries_when_resaved(tmp_path: Path) -> None:
+  index_path = tmp_path / 'index.json'
+  index = ConversationIndex(index_path)
+  kept = IndexEntry(mtime_ns=1, size=2, parent_uuid='parent', project_path='/p')
+  index.store('/projects/a/1.jsonl', kept)
+  index.store('/projects/a/2.jsonl', IndexEntry(mtime_ns=1, size=2))
+  index.save()
+
+  updated = IndexEntry(mtime_ns=3, size=4)
+  reloaded = ConversationIndex(index_path)
+  reloaded.store('/projects/a/2.jsonl', updated)
+  reloaded.save()
+
+  final = ConversationIndex(index_path)
+  assert final.lookup('/projects/a/1.jsonl', 1, 2) == kept
+  assert final.lookup('/projects/a/2.jsonl', 3, 4) == updated
+
+
+def test_index_ignores_corrupt_file(tmp_path: Path) -> None:
+  index_path = tmp_path / 'index.json'
+  index_path.write_text('{not json', encoding='utf-8')
+
+  index = ConversationIndex(index_path)
+  assert index.lookup('/projects/a/1.jsonl', 10, 20) is None
+
+
+def test_index_prune_drops_missing_files(tmp_path: Path) -> None:
+  index = ConversationIndex(tmp_path / 'index.json')
+  index.store('/projects/a/1.jsonl', IndexEntry(mtime_ns=1, size=1))
+  index.store('/projects/a/2.jsonl', IndexEntry(mtime_ns=1, size=1))
+  index.store('/projects/b/3.jsonl', IndexEntry(mtime_ns=1, size=1))
+
+  index.prune(['/projects/a'], ['/projects/a/1.jsonl'])
+
+  assert index.lookup('/projects/a/1.jsonl', 1, 1) is not None
+  assert index.lookup('/projects/a/2.jsonl', 1, 1) is None
+  assert index.lookup('/projects/b/3.jsonl', 1, 1) is not None
+
+
+def test_index_tolerates_concurrent_store_and_save(tmp_path: Path) -> None:
+  index = ConversationIndex(tmp_path / 'index.json')
+  for number in range(20000):
+    index.store(f'/projects/b/{number}.jsonl', IndexEntry(mtime_ns=1, size=1))
+  errors = []
+
+  def store_entries() -> None:
+    try:
+      for number in range(2000):
+        index.store(f'/projects/a/{number}.jsonl', IndexEntry(mtime_ns=1, size=1))
+    except RuntimeError as error:
+      errors.append(error)
+
+  writer = threading.Thread(target=store_entries)
+  writer.start()
+  try:
+    while writer.is_alive():
+      index.prune(['/projects/c'], [])
+      index.save()
+  finally:
+    writer.join()
+
+  assert errors == []
+  assert index.lookup('/projects/a/1999.jsonl', 1, 1) is not None
+
+
+def test_manager_reuses_index_between_runs(
+  projects_root: Path,
+  conversation_factory: Callable[..., Path],
+  tmp_path: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  root_uuid = '11111111-1111-1111-1111-111111111111'
+  child_uuid = '22222222-2222-2222-2222-222222222222'
+  conversation_factory(root_uuid, summary=None)
+  conversation_factory(child_uuid, parent_uuid=root_uuid, summary=None)
+  index_path = tmp_path / 'index.json'
+
+  first = ClaudeConversationManager(projects_root, index_path=index_path)
+  assert len(first.find_all_conversations(all_projects=True)) == 2
+  assert index_path.exists()
+
+  def fail_read(self, conversation_file):
+    raise AssertionError(f'Unexpected read of {conversation_file}')
+
+  monkeypatch.setattr(ClaudeConversationManager, '_get_parent_uuid', fail_read)
+
+  second = ClaudeConversationManager(projects_root, index_path=index_path)
+  conversations = second.find_all_conversations(all_projects=True)
+  parents = {conv.uuid: conv.parent_uuid for conv in conversations}
+  assert parents == {root_uuid: None, child_uuid: root_uuid}
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import errno
 import json
+import os
+import shutil
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Callable
+from typing import Callable, List, Optional
 
 import pytest
 
+from claude_bushwack import core, jsonio
 from claude_bushwack.core import (
   AmbiguousSessionIDError,
   BranchingError,
@@ -16,6 +20,7 @@ from claude_bushwack.core import (
   ConversationNotFoundError,
   InvalidUUIDError,
 )
+from claude_bushwack.jsonio import dump_json
 
 
 def test_path_round_trip(manager: ClaudeConversationManager) -> None:
@@ -27,6 +32,21 @@ def test_path_round_trip(manager: ClaudeConversationManager) -> None:
   assert manager._path_to_project_dir(decoded) == encoded
 
 
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_dump_json_output_matches_between_backends(
+  monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+  if use_orjson and jsonio.orjson is None:
+    pytest.skip('orjson is not installed')
+  if not use_orjson:
+    monkeypatch.setattr(jsonio, 'orjson', None)
+
+  value = {'cwd': '/tmp/héllo', 'n': [1, 2**70, None, True]}
+  assert dump_json(value) == (
+    '{"cwd":"/tmp/héllo","n":[1,1180591620717411303424,null,true]}'
+  )
+
+
 def test_get_and_set_parent_uuid(
   manager: ClaudeConversationManager, conversation_factory
 ) -> None:
@@ -43,6 +63,81 @@ def test_get_and_set_parent_uuid(
   assert manager._get_parent_uuid(file_path) == new_parent
 
 
+def test_set_parent_uuid_preserves_rest_of_file(
+  manager: ClaudeConversationManager, conversation_factory
+) -> None:
+  """Only the first line changes; the body is streamed through untouched."""
+  file_path = conversation_factory(
+    'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb', assistant_text='y' * (3 << 20)
+  )
+  original_rest = file_path.read_bytes().split(b'\n', 1)[1]
+
+  manager._set_parent_uuid_in_jsonl(file_path, 'cccccccc-cccc-cccc-cccc-cccccccccccc')
+
+  assert file_path.read_bytes().split(b'\n', 1)[1] == original_rest
+  assert manager._get_parent_uuid(file_path) == 'cccccccc-cccc-cccc-cccc-cccccccccccc'
+  assert [path.name for path in file_path.parent.iterdir()] == [file_path.name]
+
+  manager._clear_parent_uuid_in_jsonl(file_path)
+  assert manager._get_parent_uuid(file_path) is None
+  assert file_path.read_bytes().split(b'\n', 1)[1] == original_rest
+
+
+def test_get_parent_uuid_reads_long_first_line(
+  manager: ClaudeConversationManager, conversation_factory
+) -> None:
+  """A first line longer than the initial read still yields its parentUuid."""
+  parent_uuid = 'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa'
+  file_path = conversation_factory(
+    'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb',
+    parent_uuid=parent_uuid,
+    preview_text='x' * 100_000,
+  )
+
+  assert manager._get_parent_uuid(file_path) == parent_uuid
+
+
+@pytest.mark.parametrize(
+  ('first_line', 'expected'),
+  [
+    (b'{"parentUuid":null,"type":"user"}', None),
+    (
+      b'{"parentUuid": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa", "type": "user"}',
+      'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa',
+    ),
+    (
+      b'{"type":"user","parentUuid":"bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"}',
+      'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb',
+    ),
+    (b'{"parentUuid":"not-a-uuid"}', 'not-a-uuid'),
+    (b'not json', None),
+  ],
+)
+def test_parse_parent_uuid(first_line: bytes, expected: Optional[str]) -> None:
+  """Leading parentUuid keys are matched directly; other lines are decoded."""
+  assert ClaudeConversationManager._parse_parent_uuid(first_line) == expected
+
+
+def test_read_head_metadata_matches_separate_reads(
+  manager: ClaudeConversationManager, conversation_factory
+) -> None:
+  """The fused head read returns what the two single-purpose readers do."""
+  file_path = conversation_factory(
+    'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb',
+    parent_uuid='aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa',
+    extra_lines=[SimpleNamespace(type='system', content={'cwd': '/work/project'})],
+  )
+
+  assert manager._read_head_metadata(file_path) == (
+    manager._get_parent_uuid(file_path),
+    manager._get_project_path_from_jsonl(file_path),
+  )
+  assert manager._read_head_metadata(file_path) == (
+    'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa',
+    '/work/project',
+  )
+
+
 def test_find_all_conversations_current_project(
   populated_manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -90,6 +185,64 @@ def test_find_all_conversations_filters(
   assert len(all_projects) == len(filtered)
 
 
+def test_missing_projects_dir_yields_no_conversations(tmp_path: Path) -> None:
+  """A projects root that does not exist behaves like an empty one."""
+  manager = ClaudeConversationManager(claude_projects_dir=tmp_path / 'absent')
+
+  assert manager.find_all_conversations(all_projects=True) == []
+  assert manager.find_all_conversations(project_filter=str(tmp_path)) == []
+  assert manager.find_children_of('11111111-1111-1111-1111-111111111111') == []
+  with pytest.raises(ConversationNotFoundError):
+    manager.find_conversation('1111')
+
+
+def test_find_all_conversations_reads_many_files_in_parallel(
+  manager: ClaudeConversationManager, conversation_factory
+) -> None:
+  """Enough unindexed files go through the thread pool with the same results."""
+  parent_uuid = 'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa'
+  expected = {}
+  for index in range(12):
+    uuid = f'{index:08d}-0000-0000-0000-000000000000'
+    conversation_factory(uuid, parent_uuid=parent_uuid if index % 2 else None)
+    expected[uuid] = parent_uuid if index % 2 else None
+
+  conversations = manager.find_all_conversations(all_projects=True)
+
+  assert {conv.uuid: conv.parent_uuid for conv in conversations} == expected
+  assert len(manager.find_children_of(parent_uuid)) == 6
+
+
+def test_find_all_conversations_resolves_project_path_once_per_directory(
+  manager: ClaudeConversationManager,
+  conversation_factory,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """Files in one project directory share a single metadata lookup."""
+  project_path = '/Users/kyle/Code/my-projects/claude-bushwack'
+  for index in range(3):
+    conversation_factory(
+      f'{index:08d}-0000-0000-0000-000000000000',
+      extra_lines=[SimpleNamespace(type='system', content={'cwd': project_path})],
+    )
+
+  calls: list[Path] = []
+  original = ClaudeConversationManager._get_project_path_from_jsonl
+
+  def _recording(self, conversation_file: Path):
+    calls.append(conversation_file)
+    return original(self, conversation_file)
+
+  monkeypatch.setattr(
+    ClaudeConversationManager, '_get_project_path_from_jsonl', _recording
+  )
+
+  conversations = manager.find_all_conversations(all_projects=True)
+
+  assert {conv.project_path for conv in conversations} == {project_path}
+  assert len(calls) == 1
+
+
 def test_find_conversation_success(
   populated_manager: ClaudeConversationManager,
 ) -> None:
@@ -101,12 +254,50 @@ def test_find_conversation_success(
   assert partial.uuid.startswith('2222')
 
 
+def test_find_conversation_full_uuid_skips_listing(
+  populated_manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """A full UUID is resolved without listing every conversation."""
+
+  def _fail(*args, **kwargs):
+    raise AssertionError('find_all_conversations should not be called')
+
+  monkeypatch.setattr(populated_manager, 'find_all_conversations', _fail)
+
+  child = populated_manager.find_conversation('22222222-2222-2222-2222-222222222222')
+  assert child.parent_uuid == '11111111-1111-1111-1111-111111111111'
+  with pytest.raises(ConversationNotFoundError):
+    populated_manager.find_conversation('44444444-4444-4444-4444-444444444444')
+
+
+def test_find_conversation_partial_reads_only_matching_files(
+  populated_manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """A partial UUID only opens files whose names start with it."""
+  read_paths: List[Path] = []
+  original = populated_manager._get_parent_uuid
+
+  def _recording(file_path: Path) -> Optional[str]:
+    read_paths.append(file_path)
+    return original(file_path)
+
+  monkeypatch.setattr(populated_manager, '_get_parent_uuid', _recording)
+
+  match = populated_manager.find_conversation('2222')
+
+  assert match.uuid.startswith('2222')
+  assert read_paths
+  assert all(path.name.startswith('2222') for path in read_paths)
+
+
 def test_find_conversation_errors(
   populated_manager: ClaudeConversationManager, conversation_factory
 ) -> None:
   """find_conversation raises on invalid, missing, or ambiguous IDs."""
   with pytest.raises(InvalidUUIDError):
     populated_manager.find_conversation('INVALID!')
+  with pytest.raises(InvalidUUIDError):
+    populated_manager.find_conversation('2222\n')
 
   with pytest.raises(ConversationNotFoundError):
     populated_manager.find_conversation('44444444-4444-4444-4444-444444444444')
@@ -207,6 +398,272 @@ def test_branch_conversation_rewrites_project_metadata(
         assert metadata['workspaceRoot'] == str(target_project_path)
 
 
+def test_branch_conversation_sets_parent_during_metadata_rewrite(
+  populated_manager: ClaudeConversationManager,
+  monkeypatch: pytest.MonkeyPatch,
+  tmp_path: Path,
+) -> None:
+  """A cross-project branch rewrites the copy once, parent line included."""
+
+  def _fail(*args, **kwargs):
+    raise AssertionError('the first line should not be rewritten separately')
+
+  monkeypatch.setattr(core, '_replace_first_line', _fail)
+  source_uuid = '22222222-2222-2222-2222-222222222222'
+
+  new_conversation = populated_manager.branch_conversation(
+    source_uuid, target_project_path=tmp_path / 'other-project'
+  )
+
+  assert populated_manager._get_parent_uuid(new_conversation.path) == source_uuid
+
+
+@pytest.mark.parametrize(
+  'record',
+  [
+    {'cwd': '/work/project', 'message': {'content': 'mentions "cwd": "/elsewhere"'}},
+    {'metadata': {'projectDir': '-work-project', 'workspaceRoot': '/wörk/prøject'}},
+    {'cwd': 'C:\\work\\project', 'projectRoot': '/work/"quoted"'},
+    {'repoPath': ['/work/one', '/work/two'], 'cwd': '/work/three'},
+  ],
+)
+def test_collect_line_candidates_matches_full_traversal(
+  manager: ClaudeConversationManager, record: dict
+) -> None:
+  """Reading values off the line finds what decoding the record would."""
+  line = json.dumps(record)
+  expected_paths: set = set()
+  expected_dirs: set = set()
+  manager._collect_metadata_candidates(record, expected_paths, expected_dirs)
+
+  paths: set = set()
+  dirs: set = set()
+  manager._collect_line_candidates(line, paths, dirs)
+
+  assert (paths, dirs) == (expected_paths, expected_dirs)
+
+
+def test_branch_conversation_keeps_unrelated_lines_verbatim(
+  manager: ClaudeConversationManager,
+  conversation_factory: Callable[..., Path],
+  tmp_path: Path,
+) -> None:
+  """Lines without project metadata are copied byte-for-byte."""
+  source_uuid = 'aaaaaaaa-1111-2222-3333-cccccccccccc'
+  source_path = conversation_factory(source_uuid, summary='Source conversation')
+  untouched = '{"type":"assistant","message":{"role":"assistant","content":"héllo"}}'
+  with source_path.open('a', encoding='utf-8') as handle:
+    handle.write(untouched + '\n')
+
+  new_conversation = manager.branch_conversation(
+    source_uuid, target_project_path=tmp_path / 'other-project'
+  )
+
+  lines = new_conversation.path.read_text(encoding='utf-8').splitlines()
+  assert lines[-1] == untouched
+
+
+def test_branch_conversation_rewrites_unescaped_non_ascii_paths(
+  manager: ClaudeConversationManager,
+  conversation_factory: Callable[..., Path],
+  tmp_path: Path,
+) -> None:
+  """Paths with escapes and raw non-ASCII characters are still rewritten."""
+  source_uuid = 'aaaaaaaa-1111-2222-3333-dddddddddddd'
+  source_path = conversation_factory(source_uuid, summary='Source conversation')
+  record = {'type': 'user', 'cwd': 'C:\\Users\\José\\proj'}
+  with source_path.open('a', encoding='utf-8') as handle:
+    handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+  target_project_path = tmp_path / 'other-project'
+  new_conversation = manager.branch_conversation(
+    source_uuid, target_project_path=target_project_path
+  )
+
+  lines = new_conversation.path.read_text(encoding='utf-8').splitlines()
+  assert json.loads(lines[-1])['cwd'] == str(target_project_path)
+
+
+def test_branch_conversation_same_project_skips_metadata_rewrite(
+  manager: ClaudeConversationManager, conversation_factory: Callable[..., Path]
+) -> None:
+  """Branching into the conversation's own project leaves the body untouched."""
+  project_path = '/Users/kyle/Code/my-projects/claude-bushwack'
+  source_uuid = 'aaaaaaaa-1111-2222-3333-dddddddddddd'
+  source_path = conversation_factory(
+    source_uuid,
+    extra_lines=[SimpleNamespace(type='user', content={'cwd': project_path})],
+  )
+
+  new_conversation = manager.branch_conversation(
+    source_uuid, target_project_path=Path(project_path)
+  )
+
+  source_lines = source_path.read_text(encoding='utf-8').splitlines()
+  new_lines = new_conversation.path.read_text(encoding='utf-8').splitlines()
+  assert new_lines[1:] == source_lines[1:]
+
+
+def test_branch_conversation_same_project_without_git_skips_reading_copy(
+  populated_manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """No metadata pass runs for a same-project branch with no branch to record."""
+
+  def _fail(*args, **kwargs):
+    raise AssertionError('_rewrite_project_metadata should not be called')
+
+  monkeypatch.setattr(populated_manager, '_rewrite_project_metadata', _fail)
+
+  source = populated_manager.find_conversation('22222222-2222-2222-2222-222222222222')
+  new_conversation = populated_manager.branch_conversation(
+    source.uuid, target_project_path=Path(source.project_path)
+  )
+
+  assert new_conversation.project_dir == source.project_dir
+
+
+def test_branch_conversation_same_project_only_rewrites_branch_lines(
+  manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """With paths unchanged, only records carrying gitBranch are decoded."""
+  project_path = tmp_path / 'repo'
+  (project_path / '.git').mkdir(parents=True)
+  (project_path / '.git' / 'HEAD').write_text('ref: refs/heads/feature\n')
+  project_dir = manager.claude_projects_dir / manager._path_to_project_dir(project_path)
+  project_dir.mkdir()
+  source_uuid = 'aaaaaaaa-1111-2222-3333-eeeeeeeeeeee'
+  lines = [
+    json.dumps({'parentUuid': None, 'cwd': str(project_path), 'gitBranch': 'main'}),
+    json.dumps({'type': 'assistant', 'cwd': str(project_path)}),
+  ]
+  (project_dir / f'{source_uuid}.jsonl').write_text('\n'.join(lines) + '\n')
+
+  rewritten: List[dict] = []
+  original = manager._rewrite_metadata_node
+
+  def _recording(value, *args):
+    rewritten.append(value)
+    return original(value, *args)
+
+  monkeypatch.setattr(manager, '_rewrite_metadata_node', _recording)
+
+  new_conversation = manager.branch_conversation(
+    source_uuid, target_project_path=project_path
+  )
+
+  new_lines = new_conversation.path.read_text(encoding='utf-8').splitlines()
+  assert json.loads(new_lines[0])['gitBranch'] == 'feature'
+  assert new_lines[1] == lines[1]
+  assert len(rewritten) == 1
+
+
+def test_detect_git_branch_is_cached_until_head_changes(
+  manager: ClaudeConversationManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """HEAD is only re-read after it changes on disk."""
+  head_file = tmp_path / 'repo' / '.git' / 'HEAD'
+  head_file.parent.mkdir(parents=True)
+  head_file.write_text('ref: refs/heads/main\n')
+
+  reads: List[Path] = []
+  original = ClaudeConversationManager._read_git_branch
+
+  def _recording(path: Path) -> Optional[str]:
+    reads.append(path)
+    return original(path)
+
+  monkeypatch.setattr(manager, '_read_git_branch', _recording)
+
+  assert manager._detect_git_branch(tmp_path / 'repo') == 'main'
+  assert manager._detect_git_branch(tmp_path / 'repo') == 'main'
+  assert len(reads) == 1
+
+  head_file.write_text('ref: refs/heads/feature\n')
+  stat_result = head_file.stat()
+  os.utime(head_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+
+  assert manager._detect_git_branch(tmp_path / 'repo') == 'feature'
+  assert len(reads) == 2
+
+
+@pytest.mark.parametrize('kernel_copy', [True, False])
+def test_copy_file_preserves_content(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kernel_copy: bool
+) -> None:
+  """Files copy the same with or without copy_file_range support."""
+  if not kernel_copy:
+
+    def _unsupported(*args, **kwargs):
+      raise OSError(errno.EXDEV, 'cross-device copy')
+
+    monkeypatch.setattr(core.os, 'copy_file_range', _unsupported, raising=False)
+  elif not hasattr(core.os, 'copy_file_range'):
+    pytest.skip('os.copy_file_range is not available')
+
+  source = tmp_path / 'source.jsonl'
+  source.write_bytes(b'{"a":1}\n' * 50_000)
+  source.chmod(0o640)
+  target = tmp_path / 'target.jsonl'
+
+  core._copy_file(source, target)
+
+  assert target.read_bytes() == source.read_bytes()
+  assert target.stat().st_mode == source.stat().st_mode
+
+
+def test_copy_file_gives_copy_a_fresh_mtime(tmp_path: Path) -> None:
+  """A copy is dated when it was made, not when its source was."""
+  source = tmp_path / 'source.jsonl'
+  source.write_bytes(b'{"a":1}\n')
+  os.utime(source, (1_000_000_000, 1_000_000_000))
+  target = tmp_path / 'target.jsonl'
+
+  core._copy_file(source, target)
+
+  assert target.stat().st_mtime > source.stat().st_mtime
+
+
+def test_rewrite_project_metadata_gives_new_copy_a_fresh_mtime(
+  manager: ClaudeConversationManager, tmp_path: Path
+) -> None:
+  """A copy written by the metadata pass is dated now even if nothing changed."""
+  source = tmp_path / 'source.jsonl'
+  source.write_text('{"type":"user","message":"hi"}\n', encoding='utf-8')
+  os.utime(source, (1_000_000_000, 1_000_000_000))
+  target = tmp_path / 'target.jsonl'
+
+  manager._rewrite_project_metadata(
+    target,
+    Path('/work/source'),
+    Path('/work/target'),
+    '-work-source',
+    '-work-target',
+    None,
+    source_file=source,
+  )
+
+  assert target.read_bytes() == source.read_bytes()
+  assert target.stat().st_mtime > source.stat().st_mtime
+
+
+def test_branch_conversation_recreates_removed_target_dir(
+  populated_manager: ClaudeConversationManager, tmp_path: Path
+) -> None:
+  """A target directory deleted after its first use is created again."""
+  target_path = tmp_path / 'custom-project'
+  source_uuid = '22222222-2222-2222-2222-222222222222'
+  first = populated_manager.branch_conversation(
+    source_uuid, target_project_path=target_path
+  )
+  shutil.rmtree(first.path.parent)
+
+  second = populated_manager.branch_conversation(
+    source_uuid, target_project_path=target_path
+  )
+
+  assert second.path.exists()
+
+
 def test_branch_conversation_error_propagation(
   populated_manager: ClaudeConversationManager, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -308,6 +765,18 @@ def test_build_conversation_tree(populated_manager: ClaudeConversationManager) -
   )
 
 
+def test_find_children_of(populated_manager: ClaudeConversationManager) -> None:
+  """find_children_of returns only direct children of the given UUID."""
+  root_uuid = '11111111-1111-1111-1111-111111111111'
+  children = populated_manager.find_children_of(root_uuid)
+  assert [child.uuid for child in children] == ['22222222-2222-2222-2222-222222222222']
+  assert children[0].parent_uuid == root_uuid
+
+  assert (
+    populated_manager.find_children_of('44444444-4444-4444-4444-444444444444') == []
+  )
+
+
 def test_get_conversation_ancestry(
   populated_manager: ClaudeConversationManager,
 ) -> None:
@@ -326,6 +795,31 @@ def test_get_conversation_ancestry(
   assert [item.uuid for item in orphan] == ['33333333-3333-3333-3333-333333333333']
 
 
+def test_get_conversation_ancestry_scans_once(
+  manager: ClaudeConversationManager,
+  conversation_factory,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """A deep chain is resolved from a single listing of all conversations."""
+  uuids = [f'{index:08d}-0000-0000-0000-000000000000' for index in range(5)]
+  for index, uuid in enumerate(uuids):
+    conversation_factory(uuid, parent_uuid=uuids[index - 1] if index else None)
+
+  calls = []
+  original = manager.find_all_conversations
+
+  def _counting(*args, **kwargs):
+    calls.append(kwargs)
+    return original(*args, **kwargs)
+
+  monkeypatch.setattr(manager, 'find_all_conversations', _counting)
+
+  ancestry = manager.get_conversation_ancestry(uuids[-1])
+
+  assert [item.uuid for item in ancestry] == uuids
+  assert len(calls) == 1
+
+
 def test_get_conversation_ancestry_handles_cycles(
   populated_manager: ClaudeConversationManager, conversation_factory
 ) -> None:
@@ -6,9 +6,15 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 from claude_bushwack.conversation_metadata import (
   ConversationMetadata,
+  MetadataCache,
+  clear_metadata_cache,
+  extract_conversation_message_count,
   extract_conversation_metadata,
+  extract_conversation_preview,
 )
 
 
@@ -93,3 +99,204 @@ def test_extract_metadata_handles_non_dict_message(tmp_path: Path) -> None:
   assert metadata.message_count == 1
   expected_created_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
   assert metadata.created_at == expected_created_at
+
+
+def test_extract_preview_stops_after_header_fields(tmp_path: Path) -> None:
+  path = tmp_path / 'long.jsonl'
+  records = [
+    {'type': 'summary', 'summary': 'Long conversation'},
+    {
+      'type': 'user',
+      'timestamp': '2024-02-01T08:00:00Z',
+      'gitBranch': 'main',
+      'message': {'role': 'user', 'content': 'First prompt'},
+    },
+  ]
+  # Anything after the header records must not be needed for the preview.
+  _write_jsonl(path, records, trailing='{not json}\n' * 1000)
+
+  preview = extract_conversation_preview(path)
+
+  assert preview.summary == 'Long conversation'
+  assert preview.preview == 'First prompt'
+  assert preview.git_branch == 'main'
+  assert preview.message_count == 0
+  assert extract_conversation_message_count(path) == 1
+
+
+def test_extract_preview_matches_full_metadata(sample_conversation: Path) -> None:
+  preview = extract_conversation_preview(sample_conversation)
+  metadata = extract_conversation_metadata(sample_conversation)
+
+  assert preview.summary == metadata.summary
+  assert preview.preview == metadata.preview
+  assert preview.created_at == metadata.created_at
+  assert preview.git_branch == metadata.git_branch
+  assert extract_conversation_message_count(sample_conversation) == 3
+
+
+def test_extract_metadata_cache_invalidates_on_append(tmp_path: Path) -> None:
+  path = tmp_path / 'growing.jsonl'
+  record = {
+    'type': 'user',
+    'timestamp': '2024-03-01T00:00:00Z',
+    'message': {'role': 'user', 'content': 'Hello'},
+  }
+  _write_jsonl(path, [record])
+
+  first = extract_conversation_metadata(path)
+  assert extract_conversation_metadata(path) is first
+  assert first.message_count == 1
+
+  with path.open('a', encoding='utf-8') as handle:
+    handle.write(json.dumps(record))
+    handle.write('\n')
+
+  assert extract_conversation_metadata(path).message_count == 2
+
+  clear_metadata_cache()
+  assert extract_conversation_metadata(path) is not first
+
+
+def test_extract_metadata_caps_preview_length(tmp_path: Path) -> None:
+  path = tmp_path / 'long_message.jsonl'
+  records = [
+    {
+      'type': 'user',
+      'timestamp': '2024-01-01T00:00:00Z',
+      'gitBranch': 'main',
+      'message': {
+        'role': 'user',
+        'content': [{'type': 'text', 'text': 'x' * 400} for _ in range(50)],
+      },
+    }
+  ]
+  _write_jsonl(path, records)
+
+  capped = extract_conversation_metadata(path, preview_chars=1000)
+  full = extract_conversation_metadata(path)
+
+  assert capped.preview == ' '.join(['x' * 400] * 3)[:1000]
+  assert full.preview == ' '.join(['x' * 400] * 50)
+
+
+def test_extract_metadata_skips_parsing_irrelevant_lines(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  from claude_bushwack import conversation_metadata
+
+  path = tmp_path / 'snapshots.jsonl'
+  records = [
+    {'type': 'file-history-snapshot', 'snapshot': {'files': []}},
+    {'type': 'file-history-snapshot', 'snapshot': {'files': []}},
+    {
+      'type': 'user',
+      'timestamp': '2024-01-01T00:00:00Z',
+      'gitBranch': 'main',
+      'message': {'role': 'user', 'content': 'Hello'},
+    },
+  ]
+  _write_jsonl(path, records)
+  parsed: list[bytes] = []
+  real_load_json = conversation_metadata.load_json
+
+  def _recording_load_json(data):
+    parsed.append(data)
+    return real_load_json(data)
+
+  monkeypatch.setattr(conversation_metadata, 'load_json', _recording_load_json)
+  clear_metadata_cache()
+
+  metadata = extract_conversation_metadata(path)
+
+  assert metadata.preview == 'Hello'
+  assert metadata.message_count == 1
+  assert len(parsed) == 2
+
+
+def test_extract_metadata_reuses_discovered_stat(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  from claude_bushwack import conversation_metadata
+  from claude_bushwack.core import ConversationFile
+
+  path = tmp_path / 'stat.jsonl'
+  _write_jsonl(
+    path, [{'type': 'user', 'message': {'role': 'user', 'content': 'Stat once'}}]
+  )
+  stat_result = path.stat()
+  conversation = ConversationFile(
+    path=path,
+    uuid='stat',
+    project_dir='-tmp',
+    project_path='/tmp',
+    last_modified=datetime.now(),
+    mtime_ns=stat_result.st_mtime_ns,
+    size=stat_result.st_size,
+  )
+
+  def _fail_stat(*args, **kwargs):
+    raise AssertionError('metadata extraction should not stat the file again')
+
+  monkeypatch.setattr(conversation_metadata.os, 'stat', _fail_stat)
+  clear_metadata_cache()
+
+  assert extract_conversation_metadata(conversation).preview == 'Stat once'
+
+
+@pytest.mark.parametrize('mappable', [True, False])
+def test_extract_metadata_counts_messages_after_header(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mappable: bool
+) -> None:
+  from claude_bushwack import conversation_metadata
+
+  path = tmp_path / 'counted.jsonl'
+  header = {
+    'type': 'user',
+    'timestamp': '2024-03-01T00:00:00Z',
+    'gitBranch': 'main',
+    'message': {'role': 'user', 'content': 'Hello'},
+  }
+  reply = {'type': 'assistant', 'message': {'role': 'assistant', 'content': 'Hi'}}
+  nested = {'type': 'system', 'error': {'message': 'not a message record'}}
+  _write_jsonl(
+    path,
+    [header, reply, nested, {'type': 'file-history-snapshot'}, reply],
+    trailing='\n' + json.dumps(reply),
+  )
+
+  if not mappable:
+
+    def _fail_mmap(*args, **kwargs):
+      raise OSError('mmap unavailable')
+
+    monkeypatch.setattr(conversation_metadata.mmap, 'mmap', _fail_mmap)
+  clear_metadata_cache()
+
+  assert extract_conversation_metadata(path).message_count == 4
+
+
+def test_metadata_cache_round_trips_through_disk(tmp_path: Path) -> None:
+  cache_path = tmp_path / 'cache' / 'metadata.json'
+  metadata = ConversationMetadata(
+    preview='Hello',
+    summary='Greeting',
+    created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+    message_count=3,
+    git_branch='main',
+  )
+  cache = MetadataCache(cache_path)
+  cache.store('/projects/a/1.jsonl', 10, 20, metadata)
+  cache.save()
+
+  reloaded = MetadataCache(cache_path)
+  assert reloaded.lookup('/projects/a/1.jsonl', 10, 20) == metadata
+  assert reloaded.lookup('/projects/a/1.jsonl', 11, 20) is None
+  assert reloaded.lookup('/projects/a/1.jsonl', 10, 21) is None
+
+
+def test_metadata_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+  cache_path = tmp_path / 'metadata.json'
+  cache_path.write_text('{not json', encoding='utf-8')
+
+  assert MetadataCache(cache_path).lookup('/projects/a/1.jsonl', 10, 20) is None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import sys
 import types
 from datetime import datetime
@@ -13,7 +14,7 @@ from typing import Callable, Iterable
 import pytest
 from click.testing import CliRunner
 
-from claude_bushwack.cli import main
+from claude_bushwack.cli import _format_timestamp, main
 from claude_bushwack.conversation_metadata import ConversationMetadata
 from claude_bushwack.core import ClaudeConversationManager, ConversationFile
 from claude_bushwack.exceptions import (
@@ -78,6 +79,13 @@ class _RecordingManager:
     self.calls.append(('get_conversation_ancestry', (session_id,), {}))
     return []
 
+  def find_children_of(self, parent_uuid: str):
+    self.calls.append(('find_children_of', (parent_uuid,), {}))
+    return sorted(
+      (conv for conv in self._conversations if conv.parent_uuid == parent_uuid),
+      key=lambda conv: conv.last_modified,
+    )
+
 
 def test_main_help(runner: CliRunner) -> None:
   result = runner.invoke(main, ['--help'])
@@ -85,6 +93,18 @@ def test_main_help(runner: CliRunner) -> None:
   assert 'Claude Bushwack' in result.output
 
 
+@pytest.mark.parametrize(
+  'value',
+  [
+    datetime(2024, 1, 2, 3, 4, 59),
+    datetime(2024, 11, 30),
+    datetime(2025, 12, 31, 23, 0),
+  ],
+)
+def test_format_timestamp_matches_strftime(value: datetime) -> None:
+  assert _format_timestamp(value) == value.strftime('%Y-%m-%d %H:%M')
+
+
 def test_list_command_default_scope(
   monkeypatch: pytest.MonkeyPatch, runner: CliRunner
 ) -> None:
@@ -138,9 +158,7 @@ def test_list_command_tree(monkeypatch: pytest.MonkeyPatch, runner: CliRunner) -
     calls.append(conversation.uuid)
     return metadata_by_uuid[conversation.uuid]
 
-  monkeypatch.setattr(
-    'claude_bushwack.cli.extract_conversation_metadata', _fake_extract
-  )
+  monkeypatch.setattr('claude_bushwack.cli.extract_conversation_preview', _fake_extract)
   result = runner.invoke(main, ['list', '--tree'])
   assert result.exit_code == 0
   assert '🌳 Conversation Tree' in result.output
@@ -151,6 +169,77 @@ def test_list_command_tree(monkeypatch: pytest.MonkeyPatch, runner: CliRunner) -
   assert set(calls) == {root.uuid, child.uuid}
 
 
+def test_list_command_tree_orders_children_oldest_first(
+  monkeypatch: pytest.MonkeyPatch, runner: CliRunner
+) -> None:
+  root = _conversation('11111111-1111-1111-1111-111111111111')
+  newer = _conversation(
+    '22222222-2222-2222-2222-222222222222',
+    parent_uuid=root.uuid,
+    last_modified=datetime(2024, 3, 1),
+  )
+  older = _conversation(
+    '33333333-3333-3333-3333-333333333333',
+    parent_uuid=root.uuid,
+    last_modified=datetime(2024, 2, 1),
+  )
+  manager = _RecordingManager([root, newer, older])
+  monkeypatch.setattr('claude_bushwack.cli.ClaudeConversationManager', lambda: manager)
+  monkeypatch.setattr(
+    'claude_bushwack.cli.extract_conversation_preview',
+    lambda conv: ConversationMetadata(),
+  )
+  result = runner.invoke(main, ['list', '--tree'])
+  assert result.exit_code == 0
+  assert result.output.index(older.uuid[:8]) < result.output.index(newer.uuid[:8])
+
+
+def test_list_command_tree_lists_orphaned_branches(
+  monkeypatch: pytest.MonkeyPatch, runner: CliRunner
+) -> None:
+  root = _conversation('11111111-1111-1111-1111-111111111111')
+  child = _conversation('22222222-2222-2222-2222-222222222222', parent_uuid=root.uuid)
+  orphan = _conversation(
+    '33333333-3333-3333-3333-333333333333',
+    parent_uuid='99999999-9999-9999-9999-999999999999',
+  )
+  manager = _RecordingManager([root, child, orphan])
+  monkeypatch.setattr('claude_bushwack.cli.ClaudeConversationManager', lambda: manager)
+  monkeypatch.setattr(
+    'claude_bushwack.cli.extract_conversation_preview',
+    lambda conv: ConversationMetadata(summary=f'Summary {conv.uuid[:4]}'),
+  )
+  result = runner.invoke(main, ['list', '--tree'])
+  assert result.exit_code == 0
+  orphan_section = result.output.split('Orphaned branches')[1]
+  assert orphan.uuid[:8] in orphan_section
+  assert 'parent: 99999999...' in orphan_section
+  assert child.uuid[:8] not in orphan_section
+
+
+def test_list_command_reads_metadata_in_parallel(
+  monkeypatch: pytest.MonkeyPatch, runner: CliRunner
+) -> None:
+  conversations = [
+    _conversation(f'{index:08d}-1111-1111-1111-111111111111') for index in range(24)
+  ]
+  manager = _RecordingManager(conversations)
+  monkeypatch.setattr('claude_bushwack.cli.ClaudeConversationManager', lambda: manager)
+  calls: list[str] = []
+
+  def _fake_extract(conversation):
+    calls.append(conversation.uuid)
+    return ConversationMetadata(message_count=int(conversation.uuid[:8]))
+
+  monkeypatch.setattr(
+    'claude_bushwack.cli.extract_conversation_metadata', _fake_extract
+  )
+  result = runner.invoke(main, ['list', '--jobs', '4'])
+  assert result.exit_code == 0
+  assert sorted(calls) == sorted(conv.uuid for conv in conversations)
+  assert 'Found 24 conversation(s)' in result.output
+
+
 def test_branch_command_success(
   monkeypatch: pytest.MonkeyPatch, runner: CliRunner
 ) -> None:
@@ -357,3 +446,16 @@ def test_tui_command_missing_textual(
   result = runner.invoke(main, ['tui'])
   assert result.exit_code != 0
   assert 'Textual is not installed' in result.output
+
+
+def test_importing_cli_skips_textual_and_rich() -> None:
+  """The CLI module loads Textual and Rich only when a command needs them."""
+  code = (
+    'import sys, claude_bushwack.cli; '
+    "print(sorted({m.split('.')[0] for m in sys.modules} & {'rich', 'textual'}))"
+  )
+  env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+  result = subprocess.run(
+    [sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True
+  )
+  assert result.stdout.strip() == '[]'
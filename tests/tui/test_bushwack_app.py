@@ -11,10 +11,11 @@ from typing import List, Optional
 
 import pytest
 
-from claude_bushwack.conversation_metadata import ConversationMetadata
+from claude_bushwack.conversation_metadata import ConversationMetadata, MetadataCache
 from claude_bushwack.core import ClaudeConversationManager, ConversationFile
 from claude_bushwack.exceptions import ConversationNotFoundError
 from rich.text import Text
+from textual.widgets import Tree
 
 from claude_bushwack.tui import (
   BushwackApp,
@@ -338,6 +339,43 @@ def test_branch_conversation_success(
   assert any('Branched' in message for message in messages)
 
 
+def test_branch_conversation_appends_node_under_parent(
+  bushwack_app: BushwackApp, conversation_factory, populated_manager, project_cwd: Path
+):
+  new_uuid = '77777777-7777-7777-7777-777777777777'
+  source_uuid = '11111111-1111-1111-1111-111111111111'
+
+  def fake_branch(uuid: str, target_project_path: Optional[Path] = None):
+    path = conversation_factory(new_uuid, parent_uuid=uuid, summary=None)
+    return ConversationFile(
+      path=path,
+      uuid=new_uuid,
+      project_dir=populated_manager._path_to_project_dir(project_cwd),
+      project_path=str(project_cwd),
+      last_modified=datetime.now(tz=timezone.utc),
+      parent_uuid=uuid,
+    )
+
+  bushwack_app.conversation_manager.branch_conversation = fake_branch
+
+  async def _interaction(pilot) -> None:
+    tree = bushwack_app.query_one('#conversation_tree')
+    await pilot.pause()
+    parent = bushwack_app._node_lookup[source_uuid]
+    child_count = parent.data.child_count
+    tree.select_node(parent)
+    bushwack_app._set_selected_from_node(parent)
+    bushwack_app.action_branch_conversation()
+    await pilot.pause()
+
+    assert bushwack_app._node_lookup[source_uuid] is parent
+    assert bushwack_app._node_lookup[new_uuid].parent is parent
+    assert parent.data.child_count == child_count + 1
+    assert tree.cursor_node is bushwack_app._node_lookup[new_uuid]
+
+  run_app(bushwack_app, _interaction)
+
+
 def test_branch_conversation_skips_picker(
   monkeypatch: pytest.MonkeyPatch,
   bushwack_app: BushwackApp,
@@ -625,6 +663,29 @@ def test_refresh_tree_updates_status(
   assert any('Refreshing conversations' in message for message in messages)
 
 
+def test_refresh_keeps_tree_when_files_unchanged(
+  bushwack_app: BushwackApp, populated_manager: ClaudeConversationManager
+):
+  root_uuid = '11111111-1111-1111-1111-111111111111'
+
+  async def _interaction(pilot) -> None:
+    await pilot.pause()
+    original = bushwack_app._node_lookup[root_uuid]
+
+    bushwack_app.action_refresh_tree()
+    await pilot.pause()
+    assert bushwack_app._node_lookup[root_uuid] is original
+
+    root_path = next(populated_manager.claude_projects_dir.rglob(f'{root_uuid}.jsonl'))
+    with root_path.open('a', encoding='utf-8') as handle:
+      handle.write('\n')
+    bushwack_app.action_refresh_tree()
+    await pilot.pause()
+    assert bushwack_app._node_lookup[root_uuid] is not original
+
+  run_app(bushwack_app, _interaction)
+
+
 def test_all_scope_includes_project_path_column(bushwack_app: BushwackApp):
   async def _interaction(pilot) -> None:
     await pilot.pause()
@@ -943,7 +1004,7 @@ def test_extract_display_data_delegates_to_core_helper(
 
   captured = {}
 
-  def fake_extract(source):
+  def fake_extract(source, **kwargs):
     captured['source'] = source
     return expected_metadata
 
@@ -959,6 +1020,77 @@ def test_extract_display_data_delegates_to_core_helper(
   assert result.git_branch == expected_metadata.git_branch
 
 
+def test_build_display_data_keeps_order_for_large_sets(
+  bushwack_app: BushwackApp, monkeypatch: pytest.MonkeyPatch
+):
+  conversations = [
+    ConversationFile(
+      path=Path(f'{index}.jsonl'),
+      uuid=str(index),
+      project_dir='proj',
+      project_path='/tmp/proj',
+      last_modified=datetime.now(tz=timezone.utc),
+    )
+    for index in range(20)
+  ]
+
+  def fake_extract(source, **kwargs):
+    return ConversationMetadata(preview=f'preview {source.uuid}')
+
+  monkeypatch.setattr('claude_bushwack.tui.extract_conversation_metadata', fake_extract)
+
+  result = bushwack_app._build_display_data(conversations)
+
+  assert list(result) == [conversation.uuid for conversation in conversations]
+  assert all(result[key].preview == f'preview {key}' for key in result)
+
+
+def test_build_display_data_reuses_saved_metadata(
+  bushwack_app: BushwackApp,
+  populated_manager: ClaudeConversationManager,
+  monkeypatch: pytest.MonkeyPatch,
+  tmp_path: Path,
+):
+  conversations = populated_manager.find_all_conversations(all_projects=True)
+  cache_path = tmp_path / 'metadata.json'
+  bushwack_app._metadata_cache = MetadataCache(cache_path)
+  first = bushwack_app._build_display_data(conversations)
+  assert cache_path.exists()
+
+  def fail_extract(source, **kwargs):
+    raise AssertionError(f'Unexpected parse of {source.path}')
+
+  monkeypatch.setattr('claude_bushwack.tui.extract_conversation_metadata', fail_extract)
+  bushwack_app._metadata_cache = MetadataCache(cache_path)
+
+  assert bushwack_app._build_display_data(conversations) == first
+
+
+def test_add_conversation_to_tree_handles_deep_chains(bushwack_app: BushwackApp):
+  base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+  chain = [
+    ConversationFile(
+      path=Path(f'{index}.jsonl'),
+      uuid=f'{index:08d}',
+      project_dir='proj',
+      project_path='/tmp/proj',
+      last_modified=base + timedelta(minutes=index),
+      parent_uuid=f'{index - 1:08d}' if index else None,
+    )
+    for index in range(2000)
+  ]
+  children_dict = {parent.uuid: [child] for parent, child in zip(chain, chain[1:])}
+  tree = Tree('Conversations')
+
+  bushwack_app._add_conversation_to_tree(
+    tree.root, chain[0], children_dict, {}, is_root=True
+  )
+
+  node = bushwack_app._node_lookup[chain[-1].uuid]
+  assert node.parent is bushwack_app._node_lookup[chain[-2].uuid]
+  assert len(bushwack_app._node_lookup) == len(chain)
+
+
 def test_expand_and_collapse_branch(
   bushwack_app: BushwackApp, monkeypatch: pytest.MonkeyPatch
 ):
@@ -972,3 +1104,16 @@ def test_expand_and_collapse_branch(
     assert node.is_expanded
 
   run_app(bushwack_app, _interaction)
+
+
+def test_cursor_bottom_selects_last_visible_node(bushwack_app: BushwackApp):
+  async def _interaction(pilot) -> None:
+    tree = bushwack_app.query_one('#conversation_tree')
+    await pilot.pause()
+    bushwack_app._expand_branch(tree.root)
+    await pilot.pause()
+    bushwack_app.action_cursor_bottom()
+    await pilot.pause()
+    assert tree.cursor_node is _visible_tree_nodes(tree)[-1]
+
+  run_app(bushwack_app, _interaction)
@@ -1,6 +1,7 @@
 """Tests for TUI ProjectDirectoryTree.decode_path() method integration."""
 
 import json
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -57,7 +58,7 @@ class TestTuiDecodePathIntegration:
     assert result is not None
     assert isinstance(result, Path)
 
-  def test_returns_none_when_iterdir_fails(
+  def test_returns_none_when_scandir_fails(
     self, temp_projects_dir, project_tree, monkeypatch
   ):
     """Should gracefully fall back to lossy decoding when directory is inaccessible."""
@@ -65,14 +66,14 @@ class TestTuiDecodePathIntegration:
     project_dir = temp_projects_dir / '-Users-kyle-Code-test-project'
     project_dir.mkdir(parents=True)
 
-    original_iterdir = Path.iterdir
+    original_scandir = os.scandir
 
-    def fake_iterdir(self):
-      if self == project_dir:
+    def fake_scandir(path='.'):
+      if Path(path) == project_dir:
         raise PermissionError('Permission denied for test')
-      return original_iterdir(self)
+      return original_scandir(path)
 
-    monkeypatch.setattr(Path, 'iterdir', fake_iterdir)
+    monkeypatch.setattr(os, 'scandir', fake_scandir)
 
     try:
       result = project_tree.decode_path(project_dir)